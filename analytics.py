@@ -0,0 +1,205 @@
+"""
+Batch analytics over accumulated LinkedIn Scraper outputs.
+
+Loads any number of exported runs (JSON, gzip JSON Lines, Parquet, or run
+journals) into pandas and works on whole columns at once: durations such as
+"2 yrs 3 mos" and the `·`-separated skills are parsed with vectorized string
+operations, and each profile's total experience is computed from its merged
+date intervals, so overlapping positions are only counted once.
+
+Usage:
+    python analytics.py <export files...> [--output-dir analytics]
+
+Writes `profiles.csv`, `companies.csv` and `skills.csv` to the output directory.
+"""
+
+import argparse
+import os
+from datetime import date
+
+import numpy as np
+import pandas as pd
+from export import read
+
+
+MONTHS = {name: index for index, name in enumerate(
+    ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"])}
+
+# "Jan 2020 - Present", "Mar 2018 - Jun 2019", "2015 - 2017"
+_DATE_RANGE = r"^\s*(?:(?P<start_month>[A-Za-z]{3})[a-z]*\s+)?(?P<start_year>\d{4})\s*[-–]\s*" \
+              r"(?:(?:(?P<end_month>[A-Za-z]{3})[a-z]*\s+)?(?P<end_year>\d{4})|(?P<present>Present))"
+
+
+def load(paths):
+    """
+    Loads exported runs into a profile table and an experience table. A profile found in several
+    runs is kept once, from the file given last.
+
+    Args:
+        paths (iterable): Export or journal files.
+
+    Returns:
+        tuple: `(profiles, experience)` DataFrames. `experience` has one row per experience entry,
+            keyed by `link`.
+    """
+    records = []
+    for path in paths:
+        run = os.path.basename(path).split(".")[0]
+        for profile in read(path):
+            records.append({
+                "link": profile.get("Profile Link"),
+                "name": profile.get("Name"),
+                "title": profile.get("Title"),
+                "location": profile.get("Location"),
+                "competency": profile.get("Competancy"),
+                "total_experience": profile.get("Total_Experiance"),
+                "run": run,
+                "Experience": profile.get("Experience") or [],
+            })
+    profiles = pd.DataFrame.from_records(records, columns=["link", "name", "title", "location", "competency",
+                                                           "total_experience", "run", "Experience"])
+    profiles = profiles.drop_duplicates("link", keep="last").reset_index(drop=True)
+
+    entries = profiles[["link", "Experience"]].explode("Experience").dropna(subset=["Experience"])
+    experience = pd.DataFrame(entries["Experience"].tolist(), index=entries.index)
+    experience = experience.reindex(columns=["role", "company", "year", "dates", "skill"])
+    experience.insert(0, "link", entries["link"].to_numpy())
+    # Typed columns keep the string operations working when no profile has experience entries
+    experience = experience.astype({column: "string" for column in ["link", "role", "company", "year", "dates"]})
+    experience["company"] = experience["company"].str.strip()
+    return profiles.drop(columns="Experience"), experience.reset_index(drop=True)
+
+
+def duration_months(durations):
+    """
+    Converts duration strings such as "2 yrs 3 mos" into months.
+
+    Args:
+        durations (pd.Series): Duration strings.
+
+    Returns:
+        pd.Series: Months as integers; unparseable values count as 0.
+    """
+    durations = durations.fillna("").astype(str)
+    years = durations.str.extract(r"(\d+)\s*yrs?", expand=False).astype(float).fillna(0)
+    months = durations.str.extract(r"(\d+)\s*mos?", expand=False).astype(float).fillna(0)
+    return (years * 12 + months).astype(int)
+
+
+def date_intervals(dates, today=None):
+    """
+    Parses date ranges such as "Jan 2020 - Present" into month intervals.
+
+    Args:
+        dates (pd.Series): Date range strings.
+        today (date): Date "Present" stands for; defaults to today.
+
+    Returns:
+        pd.DataFrame: `start` and `end` as months since year 0 (end exclusive); NaN where unparseable.
+    """
+    today = today or date.today()
+    parts = dates.fillna("").astype(str).str.extract(_DATE_RANGE)
+    start_month = parts["start_month"].str.lower().map(MONTHS).fillna(0)
+    end_month = parts["end_month"].str.lower().map(MONTHS).fillna(11)
+    start = parts["start_year"].astype(float) * 12 + start_month
+    end = parts["end_year"].astype(float) * 12 + end_month
+    end = end.where(parts["present"].isna(), today.year * 12 + today.month - 1)
+    return pd.DataFrame({"start": start, "end": end + 1})
+
+
+def skills(experience):
+    """
+    Splits the skills of every experience entry into one row per skill.
+
+    Args:
+        experience (pd.DataFrame): Experience table from `load()`.
+
+    Returns:
+        pd.DataFrame: `link`, `company` and `skill` columns.
+    """
+    exploded = experience[["link", "company", "skill"]].explode("skill").explode("skill")
+    exploded["skill"] = exploded["skill"].astype("string").str.strip()
+    return exploded[exploded["skill"].fillna("") != ""].reset_index(drop=True)
+
+
+def experience_months(experience, today=None):
+    """
+    Computes each profile's total experience. Dated entries are merged into non-overlapping
+    intervals first; entries without a date range add their stated duration.
+
+    Args:
+        experience (pd.DataFrame): Experience table from `load()`.
+        today (date): Date "Present" stands for.
+
+    Returns:
+        pd.Series: Months of experience per profile link.
+    """
+    intervals = pd.concat([experience[["link"]], date_intervals(experience["dates"], today)], axis=1)
+    dated = intervals.dropna(subset=["start", "end"]).sort_values(["link", "start"])
+
+    # A new block starts where an interval begins after everything before it (same profile) has ended
+    reach = dated.groupby("link")["end"].cummax().groupby(dated["link"]).shift()
+    block = (reach.isna() | (dated["start"] > reach)).cumsum()
+    merged = dated.groupby(block).agg(link=("link", "first"), start=("start", "min"), end=("end", "max"))
+    months = (merged["end"] - merged["start"]).groupby(merged["link"]).sum()
+
+    undated = experience.loc[~experience.index.isin(dated.index)]
+    months = months.add(duration_months(undated["year"]).groupby(undated["link"]).sum(), fill_value=0)
+    return months.reindex(experience["link"].unique(), fill_value=0).astype(int).rename("experience_months")
+
+
+def _distribution(grouped):
+    return grouped.agg(["count", "mean", "median", lambda values: np.percentile(values, 90)]).rename(
+        columns={"<lambda_0>": "p90"})
+
+
+def company_summary(experience):
+    """
+    Aggregates experience entries per company: profiles, positions and tenure distribution in months.
+    """
+    tenure = experience.assign(tenure_months=duration_months(experience["year"]))
+    grouped = tenure.groupby("company")
+    summary = pd.DataFrame({"profiles": grouped["link"].nunique(), "positions": grouped.size()})
+    summary = summary.join(_distribution(grouped["tenure_months"]).drop(columns="count").add_prefix("tenure_"))
+    return summary.sort_values("profiles", ascending=False)
+
+
+def skill_summary(experience, months):
+    """
+    Aggregates skills: profiles and companies per skill and the total experience distribution,
+    in months, of the profiles listing it.
+    """
+    table = skills(experience).drop_duplicates(["link", "skill"], keep="first")
+    table = table.join(months, on="link")
+    grouped = table.groupby("skill")
+    summary = pd.DataFrame({"profiles": grouped["link"].nunique(), "companies": grouped["company"].nunique()})
+    summary = summary.join(_distribution(grouped["experience_months"]).drop(columns="count").add_prefix("experience_"))
+    return summary.sort_values("profiles", ascending=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("paths", nargs="+", help="Exported runs (.json, .jsonl, .jsonl.gz, .parquet) or journals")
+    parser.add_argument("--output-dir", default="analytics")
+    args = parser.parse_args()
+
+    profiles, experience = load(args.paths)
+    months = experience_months(experience)
+    profiles = profiles.join(months, on="link")
+    profiles["experience_months"] = profiles["experience_months"].fillna(0).astype(int)
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    profiles.to_csv(os.path.join(args.output_dir, "profiles.csv"), index=False)
+    companies = company_summary(experience)
+    companies.to_csv(os.path.join(args.output_dir, "companies.csv"))
+    skill_table = skill_summary(experience, months)
+    skill_table.to_csv(os.path.join(args.output_dir, "skills.csv"))
+
+    print(f"{len(profiles)} profiles, {len(experience)} positions, {len(companies)} companies, "
+          f"{len(skill_table)} skills")
+    print(skill_table.head(10).to_string())
+    print("Analytics saved to " + args.output_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""
+Page archive and offline replay for the LinkedIn Scraper.
+
+With `ARCHIVE_DIR` set in `config.py`, the scraper records the HTML of every page
+it reads (the main profile page, the contact info overlay and the education and
+experience details pages). Pages are stored gzip-compressed under the SHA-256 of
+their content, so identical pages are kept once, and an SQLite index maps every
+profile URL and section to the page last recorded for it:
+
+    <archive>/index.db
+    <archive>/objects/<digest[:2]>/<digest>.html.gz
+
+When LinkedIn changes its markup and the selectors in `extractor.py` have to be
+fixed, the data can be recovered from the archive instead of scraping every
+profile again. `replay` runs the extraction over the archived pages, without a
+browser, and writes the usual export formats. Competencies come from the local
+classifier or the competency cache; replay never calls the AI service.
+
+Usage:
+    python archive.py replay [--archive archive] [--formats csv json ...]
+    python archive.py stats [--archive archive]
+"""
+
+import argparse
+import gzip
+import hashlib
+import itertools
+import os
+import sqlite3
+import time
+import config
+import extractor
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    url TEXT,
+    section TEXT,
+    digest TEXT NOT NULL,
+    recorded_at REAL,
+    PRIMARY KEY (url, section)
+);
+"""
+
+
+class PageArchive:
+    """
+    Content-addressed archive of recorded pages, keyed by profile URL and section.
+
+    Attributes:
+        directory (str): Root directory of the archive.
+        connection (sqlite3.Connection): Open connection to the page index.
+    """
+
+    def __init__(self, directory=config.ARCHIVE_DIR):
+        self.directory = directory
+        os.makedirs(os.path.join(directory, "objects"), exist_ok=True)
+        self.connection = sqlite3.connect(os.path.join(directory, "index.db"))
+        self.connection.executescript(_SCHEMA)
+
+    def _path(self, digest):
+        return os.path.join(self.directory, "objects", digest[:2], digest + ".html.gz")
+
+    def record(self, url, section, page_source):
+        """
+        Stores a page and points the URL's section at it. A page already in the archive is not written again.
+
+        Args:
+            url (str): Normalized profile URL.
+            section (str): "Profile" for the main page, or a section of `navigation.PAGES`.
+            page_source (str): HTML of the page.
+
+        Returns:
+            str: Digest of the page.
+        """
+        data = page_source.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = path + ".tmp"
+            with open(tmp, "wb") as file:
+                file.write(gzip.compress(data, compresslevel=6))
+            os.replace(tmp, path)
+        with self.connection:
+            self.connection.execute("INSERT OR REPLACE INTO pages (url, section, digest, recorded_at) VALUES (?, ?, ?, ?)",
+                                    (url, section, digest, time.time()))
+        return digest
+
+    def page(self, digest):
+        """
+        Returns the HTML of an archived page.
+        """
+        with open(self._path(digest), "rb") as file:
+            return gzip.decompress(file.read()).decode("utf-8")
+
+    def get(self, url, section):
+        """
+        Returns the HTML last recorded for a URL's section, or None.
+        """
+        row = self.connection.execute("SELECT digest FROM pages WHERE url = ? AND section = ?", (url, section)).fetchone()
+        return self.page(row[0]) if row else None
+
+    def profiles(self):
+        """
+        Streams the archived profiles one at a time.
+
+        Yields:
+            tuple: Profile URL and a dict of section to page HTML.
+        """
+        rows = self.connection.execute("SELECT url, section, digest FROM pages ORDER BY url").fetchall()
+        for url, group in itertools.groupby(rows, key=lambda row: row[0]):
+            yield url, {section: self.page(digest) for _, section, digest in group}
+
+    def stats(self):
+        """
+        Returns the number of profiles, indexed pages and stored objects and the bytes on disk.
+        """
+        profiles, pages = self.connection.execute("SELECT COUNT(DISTINCT url), COUNT(*) FROM pages").fetchone()
+        objects, size = 0, 0
+        for root, _, files in os.walk(os.path.join(self.directory, "objects")):
+            for name in files:
+                objects += 1
+                size += os.path.getsize(os.path.join(root, name))
+        return {"profiles": profiles, "pages": pages, "objects": objects, "bytes": size}
+
+    def close(self):
+        """
+        Closes the page index.
+        """
+        self.connection.close()
+
+
+def competency(about, experience, title, cache=None):
+    """
+    Infers a competency offline: the local classifier's answer when it is confident enough,
+    otherwise a cached AI result for the same input, otherwise an empty string.
+    """
+    from classifier import classify
+    from cache import cache_key
+
+    competancy, confidence = classify(about, experience, title)
+    if confidence >= config.CLASSIFIER_THRESHOLD:
+        return competancy
+    if cache is not None:
+        return cache.get(cache_key(title, experience, about)) or ""
+    return ""
+
+
+def replay(archive, cache=None):
+    """
+    Extracts every archived profile again with the current selectors.
+
+    Args:
+        archive (PageArchive): Page archive.
+        cache (CompetencyCache): Competency cache consulted when the classifier is not confident.
+
+    Yields:
+        dict: Profiles in the scraper's dict shape.
+    """
+    for url, pages in archive.profiles():
+        personeDetails, about = extractor.extract_profile(pages, url)
+        personeDetails["Competancy"] = competency(about, personeDetails.get("Experience", []),
+                                                  personeDetails.get("Title", ""), cache)
+        yield personeDetails
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--archive", default=config.ARCHIVE_DIR or "archive", help="Archive directory")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    replay_parser = commands.add_parser("replay", help="Extract the archived profiles again and export them")
+    replay_parser.add_argument("--formats", nargs="+", default=config.EXPORT_FORMATS, help="Export formats")
+    commands.add_parser("stats", help="Show the size of the archive")
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.archive):
+        parser.error(f"no archive at {args.archive}")
+    archive = PageArchive(args.archive)
+    try:
+        if args.command == "replay":
+            from cache import CompetencyCache
+            from export import export, run_id
+
+            cache = CompetencyCache()
+            started = time.perf_counter()
+            try:
+                paths = export(replay(archive, cache), run_id("replay", os.path.basename(os.path.normpath(args.archive))),
+                               args.formats)
+            finally:
+                cache.close()
+            print(f"Replayed {archive.stats()['profiles']} profiles in {time.perf_counter() - started:.1f} s")
+            for path in paths:
+                print("Output file is saved with name " + path)
+        else:
+            print("{profiles} profiles, {pages} pages, {objects} stored pages, {bytes} bytes".format(**archive.stats()))
+    finally:
+        archive.close()
+
+
+if __name__ == "__main__":
+    main()
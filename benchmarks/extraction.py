@@ -0,0 +1,290 @@
+"""
+Offline extraction benchmark for the LinkedIn Scraper.
+
+Runs the extraction hot paths against synthetic fixture pages (see
+`benchmarks/fixtures.py`) or a directory of recorded pages, without touching
+LinkedIn:
+
+- `parser` mode feeds the fixture HTML straight to the `extractor` functions.
+- `browser` mode serves the fixtures from a local HTTP server and drives a
+  headless Firefox through `LinkedInScraper.harvest()`, which loads the people
+  page a few cards at a time with its "load more" button, and
+  `LinkedInScraper.read_profile()`.
+
+For every phase (harvest, main, contact, education, experience) the benchmark
+reports latency, and in browser mode also the number of WebDriver commands and
+how much of the time went to pacing sleeps versus readiness and selector waits.
+With `--baseline` a previous JSON result is compared and the exit status is 1
+when any phase got slower than the tolerance allows.
+
+Usage:
+    python benchmarks/extraction.py [--mode parser|browser] [--profiles 10] [--iterations 50]
+                                    [--fixtures DIR] [--paced] [--lean] [--output result.json]
+                                    [--baseline previous.json] [--tolerance 0.25]
+"""
+
+import argparse
+import functools
+import http.server
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import config
+import extractor
+import fixtures
+
+
+PHASES = ["harvest", "main", "contact", "education", "experience"]
+
+
+def _summary(samples):
+    ordered = sorted(samples)
+    return {
+        "calls": len(ordered),
+        "total_s": round(sum(ordered), 6),
+        "mean_s": round(sum(ordered) / len(ordered), 6) if ordered else 0.0,
+        "p95_s": round(ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))], 6) if ordered else 0.0,
+    }
+
+
+class Meter:
+    """
+    Accumulates per-phase wall time, WebDriver commands, pacing sleeps and waits.
+    """
+
+    def __init__(self, scraper=None):
+        self.scraper = scraper
+        self.commands = 0
+        self.samples = {}
+        self.counters = {}
+
+    def _totals(self):
+        if self.scraper is None:
+            return 0, 0.0, 0.0
+        waits = sum(entry["hit_time"] + entry["miss_time"] for entry in self.scraper.waits.stats.values())
+        return self.commands, self.scraper.pacer.slept, self.scraper.pacer.waited + waits
+
+    def measure(self, phase, func, *args):
+        commands, slept, waited = self._totals()
+        start = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            elapsed = time.perf_counter() - start
+            after = self._totals()
+            self.samples.setdefault(phase, []).append(elapsed)
+            counter = self.counters.setdefault(phase, {"webdriver_commands": 0, "sleep_s": 0.0, "wait_s": 0.0})
+            counter["webdriver_commands"] += after[0] - commands
+            counter["sleep_s"] += after[1] - slept
+            counter["wait_s"] += after[2] - waited
+
+    def wrap(self, phase, func):
+        return functools.partial(self.measure, phase, func)
+
+    def exclude(self, phase, nested):
+        """
+        Turns the inclusive samples of `phase` into exclusive ones by subtracting the nested phases.
+        """
+        for name in nested:
+            for index, sample in enumerate(self.samples.get(name, [])):
+                self.samples[phase][index] -= sample
+            for key, value in self.counters.get(name, {}).items():
+                self.counters[phase][key] -= value
+
+    def report(self):
+        phases = {}
+        for phase in PHASES:
+            if phase not in self.samples:
+                continue
+            phases[phase] = _summary(self.samples[phase])
+            for key, value in self.counters.get(phase, {}).items():
+                phases[phase][key] = round(value, 6) if isinstance(value, float) else value
+        return phases
+
+
+def run_parser(pages, people, iterations):
+    """
+    Times the extractor functions on the fixture HTML, parsing included.
+    """
+    meter = Meter()
+    for _ in range(iterations):
+        if people is not None:
+            meter.measure("harvest", lambda: extractor.parse(people).xpath(
+                "//*[starts-with(@id, 'org-people-profile-card__profile-image-')]/@href"))
+        for sections in pages.values():
+            meter.measure("main", lambda: extractor.parse_profile(extractor.parse(sections["main"])))
+            meter.measure("contact", lambda: extractor.parse_contact_info(extractor.parse(sections["contact"])))
+            meter.measure("education", lambda: extractor.parse_education(extractor.parse(sections["education"])))
+            meter.measure("experience", lambda: extractor.parse_experience(extractor.parse(sections["experience"])))
+    return meter.report()
+
+
+class FixtureHandler(http.server.BaseHTTPRequestHandler):
+    """
+    Serves a fixture directory under LinkedIn-like paths.
+    """
+
+    root = None
+    routes = {"": "main", "overlay/contact-info": "contact", "details/education": "education",
+              "details/experience": "experience"}
+
+    def do_GET(self):
+        path = self.path.split("?")[0].strip("/")
+        if path == "company/people":
+            file = os.path.join(self.root, "people.html")
+        elif path.startswith("in/"):
+            slug, _, rest = path[3:].partition("/")
+            file = os.path.join(self.root, slug, self.routes.get(rest, "missing") + ".html")
+        else:
+            file = None
+        if file is None or not os.path.exists(file):
+            self.send_error(404)
+            return
+        with open(file, "rb") as handle:
+            body = handle.read()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def run_browser(root, iterations, paced, geckodriver):
+    """
+    Drives a headless Firefox through the scraper's link harvest and profile reader against the local fixture server.
+    """
+    from selenium import webdriver
+    from selenium.webdriver.firefox.service import Service
+    from pacing import Pacer
+    from scraper import LinkedInScraper
+    from waits import SelectorWait
+
+    handler = type("Handler", (FixtureHandler,), {"root": root})
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+
+    if not paced:
+        config.DELAYS = dict(config.DELAYS, scroll=(0, 0), typing=(0, 0))
+        config.SCROLL_DURATION = config.SCROLL_IDLE = 0
+
+    workdir = tempfile.mkdtemp()
+    cwd = os.getcwd()
+    os.chdir(workdir)
+    scraper = LinkedInScraper()
+    # Harvest every profile of the fixtures, so each "load more" page is read
+    scraper.number = len(fixtures.load(root))
+    options = scraper.browser_options()
+    if "-headless" not in options.arguments:
+        options.add_argument("-headless")
+    driver = webdriver.Firefox(service=Service(executable_path=geckodriver), options=options)
+    try:
+        scraper._driver = driver
+        scraper.waits = SelectorWait(driver, stats_file=None)
+        if not paced:
+            scraper.pacer = Pacer(rpm=60000, burst=1000, min_gap=0, jitter=(0, 0))
+
+        meter = Meter(scraper)
+        execute = driver.execute
+
+        def counted(command, params=None):
+            meter.commands += 1
+            return execute(command, params)
+
+        driver.execute = counted
+        scraper.get_contact_info = meter.wrap("contact", scraper.get_contact_info)
+        scraper.education = meter.wrap("education", scraper.education)
+        scraper.experience = meter.wrap("experience", scraper.experience)
+
+        def harvest():
+            scraper.pacer.throttle()
+            driver.get(base + "/company/people")
+            return scraper.harvest()
+
+        for _ in range(iterations):
+            frontier = meter.measure("harvest", harvest)
+            for url in frontier:
+                meter.measure("main", scraper.read_profile, url)
+        meter.exclude("main", ["contact", "education", "experience"])
+        scraper.pipeline.close()
+        scraper.cache.close()
+        scraper.store.close()
+        return meter.report()
+    finally:
+        driver.quit()
+        server.shutdown()
+        os.chdir(cwd)
+
+
+def compare(result, baseline, tolerance):
+    """
+    Returns the phases whose mean latency regressed beyond the tolerance.
+    """
+    regressions = []
+    for phase, stats in result["phases"].items():
+        previous = baseline.get("phases", {}).get(phase)
+        if previous and previous["mean_s"] > 0 and stats["mean_s"] > previous["mean_s"] * (1 + tolerance):
+            regressions.append({"phase": phase, "baseline_s": previous["mean_s"], "mean_s": stats["mean_s"]})
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mode", choices=["parser", "browser"], default="parser")
+    parser.add_argument("--profiles", type=int, default=10, help="Number of synthetic profiles to generate")
+    parser.add_argument("--iterations", type=int, default=None,
+                        help="Passes over all profiles (default 50 in parser mode, 1 in browser mode)")
+    parser.add_argument("--fixtures", help="Directory of recorded pages to use instead of synthetic ones")
+    parser.add_argument("--paced", action="store_true", help="Browser mode: keep the configured pacing and dwell delays")
+    parser.add_argument("--lean", action="store_true", help="Browser mode: use the lean browser settings from config.py")
+    parser.add_argument("--geckodriver", default="/usr/local/bin/geckodriver")
+    parser.add_argument("--output", help="Write the JSON result to this file instead of stdout")
+    parser.add_argument("--baseline", help="Previous JSON result to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative slowdown per phase")
+    args = parser.parse_args()
+    iterations = args.iterations or (50 if args.mode == "parser" else 1)
+    if args.lean:
+        config.BROWSER_LEAN = True
+
+    with tempfile.TemporaryDirectory() as generated:
+        root = args.fixtures
+        if root is None:
+            root = generated
+            fixtures.generate(root, args.profiles)
+        if args.mode == "parser":
+            pages = fixtures.load(root)
+            count = len(pages)
+            people = None
+            if os.path.exists(os.path.join(root, "people.html")):
+                with open(os.path.join(root, "people.html"), encoding="utf-8") as file:
+                    people = file.read()
+            phases = run_parser(pages, people, iterations)
+        else:
+            count = len(fixtures.load(root))
+            phases = run_browser(root, iterations, args.paced, args.geckodriver)
+
+    result = {"mode": args.mode, "profiles": count, "iterations": iterations, "phases": phases}
+    if args.baseline:
+        with open(args.baseline) as file:
+            result["regressions"] = compare(result, json.load(file), args.tolerance)
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(result, file, indent=4)
+    else:
+        print(json.dumps(result, indent=4))
+    sys.exit(1 if result.get("regressions") else 0)
+
+
+if __name__ == "__main__":
+    main()
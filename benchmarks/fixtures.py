@@ -0,0 +1,222 @@
+"""
+Synthetic LinkedIn page fixtures for the offline benchmarks.
+
+The pages mirror the structure the scraper's selectors expect: the top card read
+by `read_profile()`, the contact info overlay, the education and experience
+details pages, and the company people page with its "load more" button. Fixtures are written to a directory
+laid out as
+
+    <root>/people.html
+    <root>/<slug>/main.html
+    <root>/<slug>/contact.html
+    <root>/<slug>/education.html
+    <root>/<slug>/experience.html
+
+which is also the layout expected for recorded pages passed with `--fixtures`.
+"""
+
+import os
+import random
+
+from scraper import LOAD_MORE
+
+
+SECTIONS = ("main", "contact", "education", "experience")
+
+_FIRST = ["Asha", "Rahul", "Maria", "Chen", "Fatima", "Lukas", "Priya", "Omar", "Sofia", "Kenji"]
+_LAST = ["Sharma", "Gupta", "Garcia", "Wei", "Khan", "Muller", "Iyer", "Haddad", "Rossi", "Sato"]
+_ROLES = ["Software Engineer", "Senior Software Engineer", "Data Engineer", "Frontend Developer", "DevOps Engineer",
+          "QA Engineer", "Tech Lead"]
+_COMPANIES = ["Acme", "Globex", "Initech", "Umbrella", "Hooli", "Stark Industries", "Wayne Enterprises"]
+_SKILLS = ["Java", "Spring Boot", "Python", "Django", "React.js", "TypeScript", "Docker", "Kubernetes", "SQL",
+           "AWS", "Selenium", "Kafka"]
+_SCHOOLS = ["IIT Delhi", "Stanford University", "TU Munich", "University of Tokyo", "NIT Trichy"]
+_DEGREES = ["Bachelor of Technology - BTech, Computer Science", "Master of Science - MS, Data Science",
+            "Bachelor of Engineering - BE, Electronics"]
+
+
+def _span(text):
+    return f'<span><span aria-hidden="true">{text}</span><span class="visually-hidden">{text}</span></span>'
+
+
+def main_page(slug, name, title, location, about):
+    return f"""<html><head><title>{name} | LinkedIn</title></head><body><main>
+<section>
+  <div>cover</div>
+  <div>
+    <div>photo</div>
+    <div>
+      <div>
+        <div><span><a href="/in/{slug}"><h1>{name}</h1></a></span></div>
+        <div>{title}</div>
+      </div>
+      <div><span>{location}</span></div>
+    </div>
+  </div>
+</section>
+<section><div>About</div><div>-</div><div><div><div><div><span>{about}</span></div></div></div></div></section>
+<section><div id="education">Education</div></section>
+<section><div id="experience">Experience</div></section>
+</main></body></html>"""
+
+
+def contact_page(slug, name, email, phone):
+    sections = [
+        ("Your Profile", f'<div><a href="/in/{slug}">linkedin.com/in/{slug}</a></div>'),
+        ("Email", f"<div><a>{email}</a></div>"),
+        ("Phone", f"<ul><li><span>{phone}</span><span>(Mobile)</span></li></ul>"),
+        ("Birthday", "<div><span>May 1</span></div>"),
+    ]
+    body = "".join(f"<section><h3>{heading}</h3>{content}</section>" for heading, content in sections)
+    return f"""<html><body><main><section><div>{body}</div></section>
+<button aria-label="Dismiss" onclick="location.href='/in/{slug}'">x</button></main></body></html>"""
+
+
+def _details(entries):
+    items = "".join(f"<li>{entry}</li>" for entry in entries)
+    return f"""<html><body><main><section><div>header</div><div><div><div><ul>{items}</ul></div></div></div></section>
+<button aria-label="Back to the main profile page" onclick="history.back()">back</button></main></body></html>"""
+
+
+def education_page(schools):
+    entries = []
+    for school, degree in schools:
+        entries.append(f"<div><div><div>logo</div><div><div><a><div><div><div><div>{_span(school)}</div></div></div></div>"
+                       f"<span><span>{degree}</span></span></a></div></div></div></div>")
+    return _details(entries)
+
+
+def experience_page(jobs):
+    entries = []
+    for job in jobs:
+        skills = "Skills: " + " · ".join(job["skills"])
+        if "roles" not in job:
+            entries.append(
+                f"<div><div><div>logo</div><div><div><a><div><div><div><div>{_span(job['role'])}</div></div></div></div>"
+                f"<span><span>{job['company']} · Full-time</span></span>"
+                f"<span><span>{job['dates']} · {job['duration']}</span></span></a></div>"
+                f"<div><ul><li>description</li><li><div><ul><li><div><div><div><span>{skills}</span>"
+                f"</div></div></div></li></ul></div></li></ul></div></div></div></div>")
+            continue
+        roles = "".join(
+            f"<li><div><div><div>-</div><div><div>{_span(role)}</div><div><ul><li>-</li><li><div><ul><li><div><div><div>"
+            f"<span>{skills}</span></div></div></div></li></ul></div></li></ul></div></div></div></div></li>"
+            for role in job["roles"])
+        entries.append(
+            f"<div><div><div>logo</div><div><div><a><div><div><div><div>{_span(job['company'])}</div></div></div></div>"
+            f"<span><span>Full-time · {job['duration']}</span></span></a></div>"
+            f"<div><ul><li><div><div><div><ul>{roles}</ul></div></div></div></li></ul></div></div></div></div>")
+    return _details(entries)
+
+
+def _at(xpath, content, before=""):
+    """
+    Wraps `content` in the elements of an absolute XPath such as `/html/body/div[2]/div`. An
+    indexed step gets empty siblings in front of it; `before` goes into the innermost of those.
+    """
+    html = content
+    for step in reversed(xpath.strip("/").split("/")):
+        tag, _, index = step.rstrip("]").partition("[")
+        siblings = [f"<{tag}></{tag}>"] * (int(index or 1) - 1)
+        if siblings and before:
+            siblings[-1], before = f"<{tag}>{before}</{tag}>", ""
+        html = "".join(siblings) + f"<{tag}>{html}</{tag}>"
+    return html
+
+
+def people_page(slugs, hidden=0, page=None):
+    """
+    Company people page with a card per slug and `hidden` out-of-network cards. With `page` set, only
+    the first `page` cards are loaded; the "load more" button at `scraper.LOAD_MORE` appends the next ones.
+    """
+    cards = []
+    for index, slug in enumerate(slugs):
+        cards.append(f'<li><a id="org-people-profile-card__profile-image-{index}" href="/in/{slug}">'
+                     f'<img alt="{slug}"></a></li>')
+    for index in range(len(slugs), len(slugs) + hidden):
+        cards.append(f'<li><div id="org-people-profile-card__profile-image-{index}">LinkedIn Member</div></li>')
+    page = page or len(cards)
+    button = f"""<button onclick="const more = document.getElementById('more').content;
+for (let i = 0; i < {page} && more.firstElementChild; i++) document.getElementById('cards').append(more.firstElementChild);
+if (!more.firstElementChild) this.remove();">Show more results</button>
+<template id="more">{''.join(cards[page:])}</template>"""
+    return _at(LOAD_MORE.rsplit("/", 1)[0], button if len(cards) > page else "", before=f'<ul id="cards">{"".join(cards[:page])}</ul>')
+
+
+def generate(root, count=10, seed=7):
+    """
+    Writes `count` synthetic profiles and a people page into `root`.
+
+    Args:
+        root (str): Output directory.
+        count (int): Number of profiles.
+        seed (int): Random seed, so runs are comparable.
+
+    Returns:
+        list: The profile slugs.
+    """
+    rng = random.Random(seed)
+    slugs = []
+    for index in range(count):
+        name = f"{rng.choice(_FIRST)} {rng.choice(_LAST)}"
+        slug = name.lower().replace(" ", "-") + f"-{index}"
+        slugs.append(slug)
+
+        jobs = []
+        for _ in range(rng.randint(2, 6)):
+            years = rng.randint(0, 5)
+            job = {
+                "company": rng.choice(_COMPANIES),
+                "duration": f"{years} yrs {rng.randint(1, 11)} mos" if years else f"{rng.randint(1, 11)} mos",
+                "dates": f"Jan {2024 - years} - Present",
+                "skills": rng.sample(_SKILLS, rng.randint(2, 5)),
+            }
+            if rng.random() < 0.25:
+                job["roles"] = rng.sample(_ROLES, 2)
+            else:
+                job["role"] = rng.choice(_ROLES)
+            jobs.append(job)
+        schools = [(rng.choice(_SCHOOLS), rng.choice(_DEGREES)) for _ in range(rng.randint(1, 3))]
+
+        pages = {
+            "main": main_page(slug, name, f"{rng.choice(_ROLES)} at {rng.choice(_COMPANIES)}", "Bengaluru, India",
+                              "I build reliable systems. " * rng.randint(1, 20)),
+            "contact": contact_page(slug, name, f"{slug}@example.com", f"+91 98{rng.randint(10000000, 99999999)}"),
+            "education": education_page(schools),
+            "experience": experience_page(jobs),
+        }
+        os.makedirs(os.path.join(root, slug), exist_ok=True)
+        for section, html in pages.items():
+            with open(os.path.join(root, slug, f"{section}.html"), "w", encoding="utf-8") as file:
+                file.write(html)
+
+    with open(os.path.join(root, "people.html"), "w", encoding="utf-8") as file:
+        hidden = max(1, count // 5)
+        file.write(people_page(slugs, hidden, page=max(1, (count + hidden) // 4)))
+    return slugs
+
+
+def load(root):
+    """
+    Loads a fixture directory.
+
+    Args:
+        root (str): Fixture directory.
+
+    Returns:
+        dict: `{slug: {section: html}}` for every profile directory with all sections.
+    """
+    profiles = {}
+    for slug in sorted(os.listdir(root)):
+        directory = os.path.join(root, slug)
+        if not os.path.isdir(directory):
+            continue
+        pages = {}
+        for section in SECTIONS:
+            path = os.path.join(directory, f"{section}.html")
+            if os.path.exists(path):
+                with open(path, encoding="utf-8") as file:
+                    pages[section] = file.read()
+        if len(pages) == len(SECTIONS):
+            profiles[slug] = pages
+    return profiles
@@ -0,0 +1,97 @@
+"""
+Startup benchmark for the LinkedIn Scraper.
+
+Imports `scraper` and builds a `LinkedInScraper` in a fresh interpreter under
+`python -X importtime`, then checks that none of the heavy modules (selenium,
+pandas, google.genai, numpy, pyarrow) were loaded and that the total import
+time stays within the budget. Exits with status 1 on a regression.
+
+Usage:
+    python benchmarks/startup.py [--budget-ms 150] [--runs 5] [--json]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ["selenium", "pandas", "google.genai", "numpy", "pyarrow"]
+
+SNIPPET = "import scraper; scraper.LinkedInScraper()"
+
+
+def run(workdir, snippet):
+    """
+    Runs a snippet in a fresh interpreter under `-X importtime`.
+
+    Returns:
+        tuple: Wall time in seconds and `(name, cumulative microseconds, top level)` per imported module.
+    """
+    env = dict(os.environ, PYTHONPATH=ROOT, PYTHONDONTWRITEBYTECODE="1")
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", snippet], cwd=workdir, env=env,
+                            capture_output=True, text=True, check=True)
+    wall = time.perf_counter() - start
+
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        modules.append((name.strip(), int(cumulative), not name[1:].startswith(" ")))
+    return wall, modules
+
+
+def measure(workdir, baseline):
+    """
+    Runs the snippet once and returns the wall time, the import time it added over a bare
+    interpreter in milliseconds, and the names of the modules it imported.
+    """
+    wall, modules = run(workdir, SNIPPET)
+    added = [(name, cumulative, top) for name, cumulative, top in modules if name not in baseline]
+    import_ms = sum(cumulative for _, cumulative, top in added if top) / 1000
+    return wall, import_ms, [name for name, _, _ in added]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--budget-ms", type=float, default=150, help="Allowed median import time in milliseconds")
+    parser.add_argument("--runs", type=int, default=5, help="Number of fresh interpreters to measure")
+    parser.add_argument("--json", action="store_true", help="Print the result as JSON")
+    args = parser.parse_args()
+
+    walls, imports, heavy = [], [], set()
+    with tempfile.TemporaryDirectory() as workdir:
+        baseline = {name for name, _, _ in run(workdir, "pass")[1]}
+        for _ in range(args.runs):
+            wall, import_ms, modules = measure(workdir, baseline)
+            walls.append(wall * 1000)
+            imports.append(import_ms)
+            heavy.update(name for name in modules
+                         for module in HEAVY_MODULES if name == module or name.startswith(module + "."))
+
+    result = {
+        "wall_ms": round(sorted(walls)[len(walls) // 2], 1),
+        "import_ms": round(sorted(imports)[len(imports) // 2], 1),
+        "budget_ms": args.budget_ms,
+        "heavy_modules": sorted(heavy),
+    }
+    result["ok"] = not heavy and result["import_ms"] <= args.budget_ms
+
+    if args.json:
+        print(json.dumps(result))
+    else:
+        print(f"Startup: {result['wall_ms']} ms wall, {result['import_ms']} ms imports (budget {args.budget_ms} ms)")
+        if heavy:
+            print("Heavy modules imported at startup: " + ", ".join(result["heavy_modules"]))
+    sys.exit(0 if result["ok"] else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+"""
+Bulk extraction over directories of saved LinkedIn pages.
+
+Every saved page (`.html`, `.htm` or `.html.gz`) below the given directories is
+one work item, extracted on a process pool with the pure functions of
+`extractor.py`. Pages are put together into profiles by the profile URL they
+declare (canonical link or `og:url`). A page that declares none belongs to the
+profile named by its file: `<slug>/<section>.html` (the layout of the benchmark
+fixtures) or `<slug>_<section>.html`, otherwise `<slug>.html`. A page's section
+is taken from its file name (`main`/`profile`, `contact`/`contact_info`,
+`education`, `experience`) and otherwise detected from the page itself. Pages
+whose section cannot be told, and further pages for a section a profile already
+has, are skipped and counted. The profiles are then streamed into the usual
+export formats.
+
+Usage:
+    python bulk.py <directories...> [--workers 8] [--chunksize 0] [--formats json csv] [--classify]
+"""
+
+import argparse
+import gzip
+import os
+import re
+import time
+import config
+import extractor
+from utils import normalize_url
+
+
+# File names (without extension), or file name suffixes, of the pages of a profile
+SECTION_FILES = {
+    "main": "Profile",
+    "profile": "Profile",
+    "contact": "Contact_info",
+    "contact_info": "Contact_info",
+    "contact-info": "Contact_info",
+    "education": "Education",
+    "experience": "Experience",
+}
+
+# Order the sections are merged in, so every profile has the scraper's key order
+SECTION_ORDER = ("Profile", "Contact_info", "Education", "Experience")
+
+EXTENSIONS = (".html", ".htm", ".html.gz")
+
+PROFILE_URL = "https://www.linkedin.com/in/"
+
+_PROFILE_SLUG = re.compile(r"/in/([^/?#]+)")
+
+
+def _stem(name):
+    for extension in EXTENSIONS:
+        if name.lower().endswith(extension):
+            return name[:-len(extension)]
+    return None
+
+
+def pages(roots):
+    """
+    Finds every saved page below the roots.
+
+    Args:
+        roots (iterable): Root directories.
+
+    Yields:
+        str: Page paths, in a stable order.
+    """
+    for root in roots:
+        for path, subdirectories, files in os.walk(root):
+            subdirectories.sort()
+            for name in sorted(files):
+                if _stem(name) is not None:
+                    yield os.path.join(path, name)
+
+
+def _read(path):
+    opener = gzip.open if path.lower().endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8", errors="replace") as file:
+        return file.read()
+
+
+def _from_name(path):
+    """
+    Returns the profile slug and section a file name stands for; either may be None.
+    """
+    stem = _stem(os.path.basename(path))
+    lowered = stem.lower()
+    if lowered in SECTION_FILES:
+        return os.path.basename(os.path.dirname(os.path.abspath(path))), SECTION_FILES[lowered]
+    for name in sorted(SECTION_FILES, key=len, reverse=True):
+        for separator in ("_", "-", "."):
+            if lowered.endswith(separator + name):
+                return stem[:-len(name) - 1], SECTION_FILES[name]
+    return stem, None
+
+
+def extract_page(path):
+    """
+    Extracts one saved page. Runs in a worker process.
+
+    Args:
+        path (str): Page path.
+
+    Returns:
+        tuple: `(link, section, fields, about, error)`: the normalized profile URL, the section,
+            the profile keys extracted from the page and the About text of a main page. `section`
+            is None when it cannot be told; `error` is set when the page could not be read.
+    """
+    try:
+        tree = extractor.parse(_read(path))
+        slug, section = _from_name(path)
+        section = section or extractor.detect_section(tree)
+        url = extractor.canonical_url(tree)
+        found = _PROFILE_SLUG.search(url) if url else None
+        link = normalize_url(PROFILE_URL + (found.group(1) if found else slug))
+        if section is None:
+            return link, None, None, "", None
+        fields, about = extractor.extract_profile({section: tree})
+        del fields["Profile Link"]
+        return link, section, fields, about, None
+    except Exception as e:
+        return None, None, None, "", f"{type(e).__name__}: {e}"
+
+
+def classify_profile(args):
+    """
+    Infers the competency of a profile with the local classifier. Runs in a worker process.
+    """
+    from archive import competency
+
+    personeDetails, about = args
+    personeDetails["Competancy"] = competency(about, personeDetails.get("Experience", []),
+                                              personeDetails.get("Title", ""))
+    return personeDetails
+
+
+def _chunksize(count, workers):
+    # Large enough to keep dispatch overhead low, small enough that every worker gets several chunks
+    return max(1, min(256, count // (workers * 8)))
+
+
+def run(roots, basename, formats=config.EXPORT_FORMATS, workers=None, chunksize=0, classify=False):
+    """
+    Extracts every saved page below the roots on a process pool, puts the pages together into
+    profiles and exports them.
+
+    Args:
+        roots (iterable): Root directories of saved pages.
+        basename (str): Path of the output files without extension.
+        formats (iterable): Export formats, see `export.EXPORTERS`.
+        workers (int): Worker processes; defaults to the number of CPUs.
+        chunksize (int): Pages handed to a worker at a time; 0 picks one from the workload.
+        classify (bool): Also infer competencies with the local classifier.
+
+    Returns:
+        tuple: Paths of the written files and a dict with the page, profile, skipped and failed
+            counts and rates.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from export import export
+
+    found = list(pages(roots))
+    workers = workers or os.cpu_count() or 1
+    chunksize = chunksize or _chunksize(len(found), workers)
+    stats = {"pages": len(found), "profiles": 0, "skipped": 0, "failed": 0}
+
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        profiles = {}
+        for done, (path, (link, section, fields, about, error)) in enumerate(
+                zip(found, pool.map(extract_page, found, chunksize=chunksize)), 1):
+            if error is not None:
+                stats["failed"] += 1
+                print(f"Extraction failed for {path}: {error}")
+            elif section is None:
+                stats["skipped"] += 1
+                print(f"Skipping {path}: not a profile page")
+            elif section in profiles.setdefault(link, {}):
+                stats["skipped"] += 1
+                print(f"Skipping {path}: {link} already has a {section} page")
+            else:
+                profiles[link][section] = (fields, about)
+            if done % 5000 == 0:
+                print(f"{done} files, {done / (time.perf_counter() - started):.0f} files/s")
+
+        def assembled():
+            for link, sections in profiles.items():
+                personeDetails, about = {"Profile Link": link}, ""
+                for section in SECTION_ORDER:
+                    if section in sections:
+                        fields, page_about = sections[section]
+                        personeDetails.update(fields)
+                        about = about or page_about
+                yield personeDetails, about
+
+        results = (pool.map(classify_profile, assembled(), chunksize=_chunksize(len(profiles), workers))
+                   if classify else (personeDetails for personeDetails, _ in assembled()))
+        stats["profiles"] = len(profiles)
+        paths = export(results, basename, formats)
+    elapsed = time.perf_counter() - started
+    stats.update(seconds=elapsed, workers=workers, chunksize=chunksize,
+                 files_per_second=stats["pages"] / elapsed if elapsed else 0.0,
+                 profiles_per_second=stats["profiles"] / elapsed if elapsed else 0.0)
+    return paths, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("roots", nargs="+", help="Directories of saved pages")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: number of CPUs)")
+    parser.add_argument("--chunksize", type=int, default=0, help="Pages per dispatched chunk (default: automatic)")
+    parser.add_argument("--formats", nargs="+", default=config.EXPORT_FORMATS, help="Export formats")
+    parser.add_argument("--output", help="Path of the output files without extension")
+    parser.add_argument("--classify", action="store_true", help="Infer competencies with the local classifier")
+    args = parser.parse_args()
+
+    from export import run_id
+
+    basename = args.output or run_id("bulk", os.path.basename(os.path.normpath(args.roots[0])))
+    paths, stats = run(args.roots, basename, args.formats, args.workers, args.chunksize, args.classify)
+    print("{profiles} profiles from {pages} files ({skipped} skipped, {failed} failed) in {seconds:.1f} s on "
+          "{workers} workers (chunksize {chunksize}): {files_per_second:.0f} files/s, "
+          "{profiles_per_second:.0f} profiles/s".format(**stats))
+    for path in paths:
+        print("Output file is saved with name " + path)
+
+
+if __name__ == "__main__":
+    main()
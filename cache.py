@@ -0,0 +1,163 @@
+"""
+Content-addressed memoization cache for AI competency results.
+
+Results are keyed by a stable hash of the normalized `(title, experience, about)`
+input and the model name. Lookups go to an in-process LRU first and then to an
+on-disk SQLite store, which is kept under a size limit by evicting the least
+recently used entries and can expire entries after a TTL.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+import config
+
+
+def _normalize(value):
+    """
+    Normalizes an input for hashing: collapses whitespace and case in strings, recursively.
+    """
+    if isinstance(value, str):
+        return " ".join(value.split()).casefold()
+    if isinstance(value, dict):
+        return {key: _normalize(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(item) for item in value]
+    return value
+
+
+def cache_key(title, experience, about, model=config.AI_MODEL):
+    """
+    Returns the cache key of a competency request.
+
+    Args:
+        title (str): Profile headline.
+        experience (list): List of experience dicts.
+        about (str): About section text.
+        model (str): Name of the model answering the request.
+
+    Returns:
+        str: Hex SHA-256 digest of the normalized input.
+    """
+    payload = json.dumps({"model": model, "title": _normalize(title), "experience": _normalize(experience),
+                          "about": _normalize(about)}, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class CompetencyCache:
+    """
+    Two-level (memory LRU, then SQLite) cache of competency results. Safe to use from several threads.
+
+    Attributes:
+        memory_entries (int): Number of entries kept in the in-process LRU.
+        max_bytes (int): Size limit of the values kept on disk.
+        ttl (float): Seconds an entry stays valid, or None to keep entries until evicted.
+        memory_hits (int): Lookups answered from memory.
+        disk_hits (int): Lookups answered from disk.
+        misses (int): Lookups that found nothing.
+    """
+
+    def __init__(self, path=config.AI_CACHE_FILE, memory_entries=config.AI_CACHE_MEMORY_ENTRIES,
+                 max_bytes=config.AI_CACHE_MAX_BYTES, ttl_days=config.AI_CACHE_TTL_DAYS):
+        self.memory_entries = memory_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl_days * 24 * 60 * 60 if ttl_days else None
+        self.memory = OrderedDict()
+        self.lock = threading.Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value TEXT, size INTEGER, created REAL, accessed REAL)")
+        self.connection.execute("CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries (accessed)")
+
+    def _remember(self, key, value, created):
+        self.memory[key] = (value, created)
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.memory_entries:
+            self.memory.popitem(last=False)
+
+    def _expired(self, created, now):
+        return self.ttl is not None and now - created > self.ttl
+
+    def get(self, key):
+        """
+        Looks a result up, memory first.
+
+        Args:
+            key (str): Cache key from `cache_key()`.
+
+        Returns:
+            str: The cached result, or None on a miss.
+        """
+        now = time.time()
+        with self.lock:
+            if key in self.memory:
+                value, created = self.memory[key]
+                if not self._expired(created, now):
+                    self.memory.move_to_end(key)
+                    self.memory_hits += 1
+                    return value
+                del self.memory[key]
+
+            row = self.connection.execute("SELECT value, created FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None or self._expired(row[1], now):
+                self.misses += 1
+                return None
+            with self.connection:
+                self.connection.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+            self._remember(key, row[0], row[1])
+            self.disk_hits += 1
+            return row[0]
+
+    def put(self, key, value):
+        """
+        Stores a result in memory and on disk, evicting the least recently used
+        disk entries when the size limit is exceeded.
+
+        Args:
+            key (str): Cache key from `cache_key()`.
+            value (str): Result to cache.
+        """
+        now = time.time()
+        with self.lock:
+            self._remember(key, value, now)
+            with self.connection:
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO entries (key, value, size, created, accessed) VALUES (?, ?, ?, ?, ?)",
+                    (key, value, len(value.encode("utf-8")), now, now))
+                total = self.connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+                if total <= self.max_bytes:
+                    return
+                for old_key, size in self.connection.execute(
+                        "SELECT key, size FROM entries ORDER BY accessed ASC").fetchall():
+                    if total <= self.max_bytes:
+                        break
+                    self.connection.execute("DELETE FROM entries WHERE key = ?", (old_key,))
+                    self.memory.pop(old_key, None)
+                    total -= size
+
+    def stats(self):
+        """
+        Returns the hit/miss counters.
+
+        Returns:
+            dict: `memory_hits`, `disk_hits`, `misses` and `hit_rate`.
+        """
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.memory_hits + self.disk_hits) / lookups, 3) if lookups else 0.0,
+        }
+
+    def close(self):
+        """
+        Closes the database connection.
+        """
+        self.connection.close()
@@ -0,0 +1,170 @@
+"""
+Local competency classifier for the LinkedIn Scraper.
+
+Most profiles already name their stack in the experience skills or the headline.
+This module scores the area of expertise and the primary programming language
+from the skills, headline, roles and About text with a keyword/alias dictionary
+and a small TF-IDF-style scorer over NumPy, and returns a confidence value so the
+remote model is only asked when the local answer is uncertain.
+"""
+
+import math
+import re
+import numpy as np
+
+
+AREAS = {
+    "Backend": ["backend", "back end", "back-end", "microservices", "rest api", "rest apis", "spring boot", "django",
+                "flask", "fastapi", "express", "node.js", "nodejs", "hibernate", "sql", "postgresql", "mysql",
+                "mongodb", "redis", "kafka", "api development", "server side", "j2ee", "laravel", "rails", ".net",
+                "asp.net"],
+    "Frontend": ["frontend", "front end", "front-end", "react", "react.js", "reactjs", "angular", "vue", "vue.js",
+                 "html", "css", "sass", "redux", "next.js", "ui development", "web development", "tailwind"],
+    "Full Stack": ["full stack", "full-stack", "fullstack", "mern", "mean stack", "mern stack"],
+    "Mobile": ["android", "ios", "mobile", "flutter", "react native", "swiftui", "jetpack compose", "xamarin"],
+    "Data Science": ["data science", "data scientist", "machine learning", "deep learning", "pandas", "numpy",
+                     "scikit-learn", "tensorflow", "pytorch", "nlp", "computer vision", "statistics", "ml", "ai",
+                     "llm", "data analysis", "data analytics"],
+    "Data Engineering": ["data engineering", "data engineer", "spark", "pyspark", "hadoop", "airflow", "etl",
+                         "databricks", "snowflake", "data pipelines", "big data", "hive", "kafka"],
+    "DevOps": ["devops", "kubernetes", "docker", "terraform", "ansible", "jenkins", "ci/cd", "aws", "azure", "gcp",
+               "cloud", "sre", "site reliability", "linux", "helm", "infrastructure"],
+    "QA": ["qa", "quality assurance", "testing", "test automation", "selenium", "cypress", "manual testing",
+           "automation testing", "appium", "junit", "testng", "sdet"],
+}
+
+LANGUAGES = {
+    "Java": ["java", "spring", "spring boot", "hibernate", "j2ee", "jsp", "servlets", "maven", "junit", "testng"],
+    "Python": ["python", "django", "flask", "fastapi", "pandas", "numpy", "pyspark", "scikit-learn", "pytorch",
+               "tensorflow"],
+    "JavaScript": ["javascript", "js", "node.js", "nodejs", "express", "react", "react.js", "reactjs", "angular",
+                   "vue", "vue.js", "jquery", "mern", "next.js", "react native"],
+    "TypeScript": ["typescript", "ts", "angular", "nestjs"],
+    "C#": ["c#", ".net", "asp.net", "dotnet", ".net core", "xamarin", "unity"],
+    "Go": ["golang", "go lang"],
+    "Kotlin": ["kotlin", "jetpack compose"],
+    "Swift": ["swift", "swiftui", "objective-c"],
+    "PHP": ["php", "laravel", "symfony", "wordpress"],
+    "Ruby": ["ruby", "rails", "ruby on rails"],
+    "C++": ["c++", "cpp", "qt"],
+    "Scala": ["scala", "akka"],
+    "Dart": ["dart", "flutter"],
+    "SQL": ["sql", "plsql", "pl/sql", "t-sql", "tsql"],
+}
+
+# Relative weight of the places a term can be found in.
+FIELD_WEIGHTS = {"skills": 2.0, "title": 1.5, "roles": 1.0, "about": 0.5}
+
+# Short aliases that are mostly something else in free text ("AI" in a recruiter's headline,
+# "ts" in a company name); they only count when listed as a skill.
+SKILL_ONLY = {"ai", "ml", "js", "ts"}
+
+# Evidence needed before a dimension is considered certain; scales the confidence. A single term,
+# even a skill, stays below 0.6.
+SATURATION = 6.5
+
+# Distinct terms a label needs to reach its full confidence; with fewer, the confidence is scaled down.
+MIN_TERMS = 2
+
+_TOKEN = re.compile(r"[a-z0-9][a-z0-9+#./-]*|\.[a-z][a-z0-9+#.]*|[+#]+")
+
+
+def _matrix(labels):
+    """
+    Builds the label x term weight matrix of one dimension, with the IDF of every term
+    computed over the labels it belongs to.
+    """
+    names = list(labels)
+    vocabulary = sorted({alias for aliases in labels.values() for alias in aliases})
+    index = {term: position for position, term in enumerate(vocabulary)}
+    matrix = np.zeros((len(names), len(vocabulary)))
+    for row, name in enumerate(names):
+        for alias in labels[name]:
+            matrix[row, index[alias]] = 1.0
+    idf = np.log(1 + len(names) / matrix.sum(axis=0))
+    return names, index, matrix * idf
+
+
+_AREA_NAMES, _AREA_INDEX, _AREA_WEIGHTS = _matrix(AREAS)
+_LANGUAGE_NAMES, _LANGUAGE_INDEX, _LANGUAGE_WEIGHTS = _matrix(LANGUAGES)
+
+
+def _terms(text):
+    """
+    Yields the unigrams, bigrams and trigrams of a text, lowercased.
+    """
+    tokens = [token.rstrip(".,") for token in _TOKEN.findall(text.lower())]
+    for size in (1, 2, 3):
+        for start in range(len(tokens) - size + 1):
+            yield " ".join(tokens[start:start + size])
+
+
+def _vector(fields, index):
+    """
+    Returns the sublinear, field-weighted term frequency vector of a profile.
+    """
+    counts = np.zeros(len(index))
+    for field, text in fields.items():
+        weight = FIELD_WEIGHTS[field]
+        for term in _terms(text):
+            if field != "skills" and term in SKILL_ONLY:
+                continue
+            position = index.get(term)
+            if position is not None:
+                counts[position] += weight
+    return np.where(counts > 0, 1 + np.log1p(counts), 0.0)
+
+
+def _best(names, weights, vector):
+    """
+    Returns the best label of a dimension and its confidence: the share of the top score,
+    scaled down while the total evidence is small or fewer than `MIN_TERMS` distinct terms support it.
+    """
+    scores = weights @ vector
+    total = scores.sum()
+    if total <= 0:
+        return None, 0.0
+    top = int(np.argmax(scores))
+    share = scores[top] / total
+    terms = np.count_nonzero((weights[top] > 0) & (vector > 0))
+    return names[top], float(share * (1 - math.exp(-total / SATURATION)) * min(1.0, terms / MIN_TERMS))
+
+
+def _skills(experience):
+    """
+    Flattens the skills of all experience entries; `skill` is either a list or a list of lists.
+    """
+    skills = []
+    for entry in experience or []:
+        for skill in entry.get("skill", []):
+            if isinstance(skill, list):
+                skills.extend(skill)
+            else:
+                skills.append(skill)
+    return skills
+
+
+def classify(about, experience, title):
+    """
+    Scores the area of expertise and primary programming language of a profile.
+
+    Args:
+        about (str): About section text.
+        experience (list): List of experience dicts.
+        title (str): Profile headline.
+
+    Returns:
+        tuple: `(competency, confidence)`; the competency reads like the AI answer
+        (e.g. "Backend Java") and the confidence is between 0 and 1.
+    """
+    fields = {
+        "skills": " , ".join(skill.strip() for skill in _skills(experience)),
+        "title": title or "",
+        "roles": " , ".join(entry.get("role", "") for entry in experience or []),
+        "about": about or "",
+    }
+    area, area_confidence = _best(_AREA_NAMES, _AREA_WEIGHTS, _vector(fields, _AREA_INDEX))
+    language, language_confidence = _best(_LANGUAGE_NAMES, _LANGUAGE_WEIGHTS, _vector(fields, _LANGUAGE_INDEX))
+    if area is None or language is None:
+        return "", 0.0
+    return f"{area} {language}", min(area_confidence, language_confidence)
@@ -5,8 +5,6 @@ This file contains all configurable parameters for the LinkedIn Scraper.
 Modify these values according to your requirements.
 """
 
-import random
-
 # API Key for Gemini AI
 # Replace with your actual API key
 # Ensure you have the required permissions and usage limits for the API
@@ -15,24 +13,169 @@ API="test"
 # File Paths
 # Path to the Cookie file where scraped data will be saved
 COOKIE_FILE = "cookies.pkl"  
+# Session cookies, saved as JSON; COOKIE_FILE is only read when this file does not exist yet
+SESSION_FILE = "session.json"
 
 
-# Randomized delays to mimic human behavior and avoid detection
-# These delays are in seconds and can be adjusted as needed
-# The delays are randomized to make the scraping process less predictable and more human-like.
+# Delay ranges in seconds, sampled again on every use to mimic human behavior.
+# For page loads the upper bound is the longest the scraper waits for the page to become ready;
+# it moves on as soon as the document is loaded and the target section is present.
+# For steps without a readiness condition (scrolling, typing) a value from the range is slept.
 DELAYS = {
-    "login_page": random.randint(3, 10), 
-    "security_check": random.randint(30, 60),
-    "search": random.randint(3, 10),
-    "search_results": random.randint(3, 10),
-    "people_page": random.randint(3, 5),
-    "search_query": random.randint(5, 10),
-    "load_more": random.randint(5, 10),
-    "profile": random.randint(5, 10),
-    "contact_info": random.randint(5, 10),
-    "scroll": random.randint(3, 5),
-    "education": random.randint(10, 20),
-    "experience": random.randint(10, 20),
-    "skills": random.randint(3, 5),
+    "login_page": (3, 10),
+    "security_check": (30, 60),
+    "search": (3, 10),
+    "search_results": (3, 10),
+    "people_page": (3, 5),
+    "search_query": (5, 10),
+    "load_more": (5, 10),
+    "profile": (5, 10),
+    "contact_info": (5, 10),
+    "scroll": (3, 5),
+    "education": (10, 20),
+    "experience": (10, 20),
+    "typing": (0.5, 1.5),
+}
+
+
+# Request pacing
+# Every request takes a token from a bucket refilled at REQUESTS_PER_MINUTE and holding at most
+# REQUEST_BURST tokens. Requests are also spaced at least MIN_GAP seconds plus a fresh JITTER sample apart.
+REQUESTS_PER_MINUTE = 8
+REQUEST_BURST = 3
+MIN_GAP = 3
+JITTER = (0.5, 2.5)
+READY_POLL = 0.25
+
+
+# Element waits
+# Every lookup records how often its selector is found and how long it takes to appear.
+# The statistics are kept in WAIT_STATS_FILE between runs and used to pick the timeout
+# of each lookup: selectors found in less than WAIT_ABSENT_RATE of at least
+# WAIT_MIN_SAMPLES lookups get WAIT_SHORT_TIMEOUT, required ones always get WAIT_TIMEOUT.
+WAIT_STATS_FILE = "wait_stats.json"
+WAIT_TIMEOUT = 10
+WAIT_SHORT_TIMEOUT = 1.5
+WAIT_MIN_SAMPLES = 5
+WAIT_ABSENT_RATE = 0.2
+WAIT_MARGIN = 2
+WAIT_HISTORY = 50
+
+
+# Result journal
+# Every finished profile is appended to <JOURNAL_DIR>/<company>_<search query>.jsonl.
+# Running the same company and search query again resumes from it; delete the file to start over.
+JOURNAL_DIR = "journals"
+
+
+# Profile store
+# Scraped profiles are kept in a SQLite database across runs. A profile scraped less than
+# STORE_TTL_DAYS days ago is taken from the store instead of being scraped again.
+STORE_FILE = "profiles.db"
+STORE_TTL_DAYS = 30
+
+
+# AI competency inference
+# AI_BACKEND is "gemini" or the URL of an HTTP endpoint taking {"model", "prompt"} and answering {"text"}.
+# Inference runs on AI_WORKERS background threads while the browser moves on; at most AI_MAX_PENDING
+# profiles wait for it at once. Failed calls are retried AI_RETRIES times with exponential backoff.
+AI_BACKEND = "gemini"
+AI_MODEL = "gemini-1.5-flash"
+AI_TIMEOUT = 60
+AI_WORKERS = 4
+AI_MAX_PENDING = 8
+AI_RETRIES = 3
+AI_BACKOFF = 2
+
+# Batched inference
+# With AI_BATCH_SIZE above 1, up to that many pending profiles are sent in one request that asks for a
+# JSON array keyed by profile ID. A batch is sent when it is full, when it reaches AI_BATCH_TOKENS
+# estimated prompt tokens, or AI_BATCH_LINGER seconds after its first profile arrived. Each field of a
+# profile is trimmed to AI_BATCH_ITEM_CHARS characters. Batches only fill up to AI_WORKERS profiles,
+# so keep AI_WORKERS at least as large as AI_BATCH_SIZE. Set AI_BATCH_SIZE to 1 for one request per profile.
+AI_BATCH_SIZE = 4
+AI_BATCH_TOKENS = 3000
+AI_BATCH_LINGER = 5
+AI_BATCH_ITEM_CHARS = 1200
+
+
+# AI result cache
+# Competency results are cached by a hash of the normalized input and the model name.
+# AI_CACHE_MEMORY_ENTRIES are kept in memory; the disk cache is trimmed to AI_CACHE_MAX_BYTES
+# by evicting the least recently used entries. Set AI_CACHE_TTL_DAYS to None to never expire entries.
+AI_CACHE_FILE = "competency_cache.db"
+AI_CACHE_MEMORY_ENTRIES = 1024
+AI_CACHE_MAX_BYTES = 16 * 1024 * 1024
+AI_CACHE_TTL_DAYS = 90
+
+
+# Local competency classifier
+# Competencies are first scored locally from skills, headline, roles and About text.
+# The AI service is only asked when the local confidence (0-1) is below CLASSIFIER_THRESHOLD;
+# set it above 1 to always use the AI service.
+CLASSIFIER_THRESHOLD = 0.6
+
+
+# Export
+# Formats written at the end of a run: "csv", "json", "jsonl" (gzip-compressed JSON Lines)
+# and "parquet" (needs pyarrow). Parquet files are written in row groups of EXPORT_ROW_GROUP profiles.
+EXPORT_FORMATS = ["csv", "json", "jsonl", "parquet"]
+EXPORT_ROW_GROUP = 500
+
+
+# Scrolling
+# The people list is scrolled with one eased animation of SCROLL_DURATION seconds run inside the page.
+# Afterwards it waits until the page height has not changed for SCROLL_IDLE seconds, at most SCROLL_MAX_WAIT.
+SCROLL_DURATION = 2
+SCROLL_IDLE = 1
+SCROLL_MAX_WAIT = 10
+
+
+# Browser
+# BROWSER_HEADLESS runs Firefox without a window. BROWSER_LEAN applies BROWSER_PREFS (no images,
+# no media autoplay, no web fonts; the scraper only reads text) and opens a BROWSER_WINDOW
+# (width, height) viewport instead of maximizing the window. BROWSER_PROFILE is the Firefox profile
+# directory reused between runs, so the session, local storage and HTTP cache stay warm; it can be
+# a trimmed profile without extensions. Set it to None to start every run from a fresh profile.
+BROWSER_HEADLESS = False
+BROWSER_LEAN = False
+BROWSER_WINDOW = (1280, 900)
+BROWSER_PROFILE = "browser_profile"
+BROWSER_PREFS = {
+    "permissions.default.image": 2,
+    "media.autoplay.default": 5,
+    "media.autoplay.blocking_policy": 2,
+    "browser.display.use_document_fonts": 0,
+    "gfx.downloadable_fonts.enabled": False,
 }
 
+
+# Profile sections
+# Detail pages read for every profile, besides the main page: any of "Contact_info", "Education"
+# and "Experience". Pages of sections left out are never loaded.
+SECTIONS = ["Contact_info", "Education", "Experience"]
+
+
+# Tracing
+# Every run writes a JSON trace of its spans to TRACE_DIR/<run id>.json, and keeps METRICS_TEXTFILE
+# (Prometheus text format) up to date during the run; point it into the node exporter's
+# textfile collector directory. Set either to None to disable it.
+TRACE_DIR = "traces"
+METRICS_TEXTFILE = "linkedin_scraper.prom"
+
+
+# Page archive
+# With ARCHIVE_DIR set, the HTML of every page read (main page, contact info, education, experience)
+# is recorded there, compressed and stored once per distinct content. `python archive.py replay`
+# extracts the archived profiles again without a browser, e.g. after the selectors were fixed.
+# Set it to None to not record pages.
+ARCHIVE_DIR = None
+
+
+# Service mode
+# `python service.py run` works through the jobs in SERVICE_QUEUE (SQLite) on one warm browser.
+# Job specs dropped as JSON files into SERVICE_SPOOL are added to the queue; with --watch the
+# service checks for new jobs every SERVICE_POLL seconds instead of exiting once the queue is empty.
+SERVICE_QUEUE = "jobs.db"
+SERVICE_SPOOL = "spool"
+SERVICE_POLL = 30
@@ -0,0 +1,215 @@
+"""
+Streaming export layer for the LinkedIn Scraper.
+
+Every exporter takes profiles one at a time and writes them straight to its file,
+so a run is exported from a generator (e.g. the journal) in a single pass without
+holding the dataset in memory. The JSON exporters encode the profile dicts as they
+are; the CSV and Parquet exporters (`records = True`) get a `models.Profile`
+record, the row schema of those two formats, built once per profile. All files of one run share one run ID.
+
+Formats:
+    csv:     One flattened row per profile.
+    json:    Indented JSON array, the scraper's original output.
+    jsonl:   Gzip-compressed JSON Lines.
+    parquet: Columnar file with Education/Experience/Contact_info as nested list columns.
+"""
+
+import csv
+import datetime
+import gzip
+import json
+import re
+import config
+from models import Profile
+
+
+CSV_FIELDS = ['Name', 'Profile Link', 'Location', 'Total Experience', 'Competency', 'Title', 'Education',
+              'Experience', 'Contact_info']
+
+
+def run_id(company, search_query, now=None):
+    """
+    Returns the ID shared by every output file of a run.
+
+    Args:
+        company (str): Target company name.
+        search_query (str): Search keyword.
+        now (datetime): Start of the run; defaults to the current time.
+
+    Returns:
+        str: `<company>_<search_query>_<YYYY-mm-dd_HH-MM-SS>`.
+    """
+    now = now or datetime.datetime.now()
+    name = re.sub(r"[^\w.-]+", "_", f"{company}_{search_query}".strip())
+    return f"{name}_{now.strftime('%Y-%m-%d_%H-%M-%S')}"
+
+
+class CSVExporter:
+    """
+    Writes one flattened row per profile.
+    """
+
+    extension = ".csv"
+    records = True
+
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, 'w', newline='')
+        self.writer = csv.DictWriter(self.file, fieldnames=CSV_FIELDS)
+        self.writer.writeheader()
+
+    def write(self, profile):
+        self.writer.writerow(profile.csv_row())
+
+    def close(self):
+        self.file.close()
+
+
+class JSONExporter:
+    """
+    Writes an indented JSON array, one profile at a time.
+    """
+
+    extension = ".json"
+    records = False
+
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, 'w')
+        self.file.write("[")
+        self.count = 0
+
+    def write(self, profile):
+        self.file.write(",\n    " if self.count else "\n    ")
+        self.file.write(json.dumps(profile, indent=4).replace("\n", "\n    "))
+        self.count += 1
+
+    def close(self):
+        self.file.write("\n]" if self.count else "]")
+        self.file.close()
+
+
+class JSONLExporter:
+    """
+    Writes gzip-compressed JSON Lines.
+    """
+
+    extension = ".jsonl.gz"
+    records = False
+
+    def __init__(self, path):
+        self.path = path
+        self.file = gzip.open(path, 'wt', encoding='utf-8')
+
+    def write(self, profile):
+        self.file.write(json.dumps(profile, ensure_ascii=False, separators=(",", ":")) + "\n")
+
+    def close(self):
+        self.file.close()
+
+
+class ParquetExporter:
+    """
+    Writes a Parquet file in row groups of `config.EXPORT_ROW_GROUP` profiles. Education,
+    Experience and Contact_info are kept as nested list columns.
+    """
+
+    extension = ".parquet"
+    records = True
+
+    def __init__(self, path):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self.pa = pa
+        self.path = path
+        self.schema = pa.schema([
+            ("Name", pa.string()),
+            ("Profile Link", pa.string()),
+            ("Title", pa.string()),
+            ("Location", pa.string()),
+            ("Total_Experiance", pa.string()),
+            ("Competancy", pa.string()),
+            ("Contact_info", pa.list_(pa.struct([("key", pa.string()), ("value", pa.string())]))),
+            ("Education", pa.list_(pa.struct([("Institute", pa.string()), ("Qualification", pa.string())]))),
+            ("Experience", pa.list_(pa.struct([("role", pa.string()), ("company", pa.string()),
+                                               ("year", pa.string()), ("dates", pa.string()),
+                                               ("skill", pa.list_(pa.string()))]))),
+            ("Fingerprint", pa.string()),
+        ])
+        self.writer = pq.ParquetWriter(path, self.schema, compression="zstd")
+        self.rows = []
+
+    def write(self, profile):
+        self.rows.append(profile.parquet_row())
+        if len(self.rows) >= config.EXPORT_ROW_GROUP:
+            self._flush()
+
+    def _flush(self):
+        if self.rows:
+            self.writer.write_table(self.pa.Table.from_pylist(self.rows, schema=self.schema))
+            self.rows = []
+
+    def close(self):
+        self._flush()
+        self.writer.close()
+
+
+def read(path):
+    """
+    Reads the profiles back from an exported file or a journal.
+
+    Args:
+        path (str): A `.json`, `.jsonl`, `.jsonl.gz` or `.parquet` file.
+
+    Yields:
+        dict: Profiles in the scraper's dict shape.
+    """
+    if path.endswith(".parquet"):
+        import pyarrow.parquet as pq
+
+        for profile in pq.read_table(path).to_pylist():
+            profile["Contact_info"] = {item["key"]: item["value"] for item in profile.get("Contact_info") or []}
+            yield profile
+    elif path.endswith(".json"):
+        with open(path, encoding="utf-8") as file:
+            yield from json.load(file)
+    else:
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "rt", encoding="utf-8") as file:
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+
+
+EXPORTERS = {
+    "csv": CSVExporter,
+    "json": JSONExporter,
+    "jsonl": JSONLExporter,
+    "parquet": ParquetExporter,
+}
+
+
+def export(profiles, basename, formats=config.EXPORT_FORMATS):
+    """
+    Writes profiles to every requested format in a single pass.
+
+    Args:
+        profiles (iterable): Profile dictionaries, e.g. a generator.
+        basename (str): Output path without extension, usually the run ID.
+        formats (iterable): Keys of `EXPORTERS`.
+
+    Returns:
+        list: Paths of the written files.
+    """
+    exporters = [EXPORTERS[name](basename + EXPORTERS[name].extension) for name in formats]
+    records = any(exporter.records for exporter in exporters)
+    try:
+        for profile in profiles:
+            record = Profile.from_dict(profile) if records else None
+            for exporter in exporters:
+                exporter.write(record if exporter.records else profile)
+    finally:
+        for exporter in exporters:
+            exporter.close()
+    return [exporter.path for exporter in exporters]
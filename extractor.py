@@ -0,0 +1,317 @@
+"""
+Offline extraction engine for LinkedIn profile pages.
+
+The functions in this module take the raw HTML of a page (a single `page_source`
+snapshot taken once the section is ready) and parse every entry with a set of
+pre-compiled XPath expressions. This replaces the per-field WebDriverWait polling,
+where every lookup was a separate WebDriver round-trip and every loop only ended
+on a timeout.
+
+`extract_profile()` puts the pages of one profile together without a browser,
+for replaying archived pages and bulk extraction over saved HTML, and
+`detect_section()` tells which page a saved file is.
+
+The returned structures have the same shape as the dictionaries the scraper has
+always produced (top card fields, `Contact_info`, `Education`, `Experience`).
+"""
+
+import re
+from lxml import etree, html
+from navigation import PAGES
+from refresh import fingerprint
+
+
+# Ready markers: the scraper waits once for these before snapshotting the page.
+CONTACT_READY = "//section/div/section"
+DETAILS_READY = "//main//section//ul/li"
+
+# Main profile page (top card)
+_PROFILE_NAME = etree.XPath("//span/a/h1")
+_PROFILE_TITLE = etree.XPath("//section/div[2]/div[2]/div/div[2]")
+_PROFILE_LOCATION = etree.XPath("//div[2]/span")
+_PROFILE_ABOUT = etree.XPath("//section[2]/div[3]/div/div/div/span")
+
+# Contact info overlay
+_CONTACT_SECTIONS = etree.XPath("//section/div/section")
+_CONTACT_HEADING = etree.XPath("h3")
+_CONTACT_CONTENT = (
+    etree.XPath("div/a"),
+    etree.XPath("div/span"),
+    etree.XPath("ul/li/span[1]"),
+)
+
+# Education details page
+_EDUCATION_ENTRIES = etree.XPath("//li[div/div/div[2]/div[1]/a/div/div/div/div/span[1]]")
+_EDUCATION_SCHOOL = etree.XPath("div/div/div[2]/div[1]/a/div/div/div/div/span[1]")
+_EDUCATION_DEGREE = etree.XPath("div/div/div[2]/div[1]/a/span/span")
+
+# Experience details page
+_EXPERIENCE_ENTRIES = etree.XPath("//main/section/div[2]/div/div[1]/ul/li")
+_EXPERIENCE_ROLE = etree.XPath("div/div/div[2]/div/a/div/div/div/div/span[1]")
+_EXPERIENCE_COMPANY = etree.XPath("div/div/div[2]/div/a/span[1]/span[1]")
+_EXPERIENCE_YEAR = etree.XPath("div/div/div[2]/div/a/span[2]/span[1]")
+_EXPERIENCE_SKILL = etree.XPath("div/div/div[2]/div[2]/ul/li[2]/div/ul/li/div/div/div/span")
+
+# Experience entries that group several roles under one company
+_GROUP_COMPANY = etree.XPath("div/div/div[2]/div[1]/a/div/div/div/div/span[1]")
+_GROUP_YEAR = etree.XPath("div/div/div[2]/div[1]/a/span/span[1]")
+_GROUP_SKILLS = etree.XPath(
+    "div/div/div[2]/div[2]/ul/li/div/div/div[1]/ul/li/div/div/div[2]/div[2]/ul/li[2]/div/ul/li/div/div/div/span[1]"
+)
+
+# URL a saved page declares for itself
+_CANONICAL = etree.XPath("//link[@rel='canonical']/@href | //meta[@property='og:url']/@content")
+
+_WHITESPACE = re.compile(r"[ \t\r\f\v]+")
+
+
+def parse(page_source):
+    """
+    Parses a page snapshot into an lxml tree.
+
+    Args:
+        page_source (str): HTML of the page as returned by `driver.page_source`.
+
+    Returns:
+        lxml.html.HtmlElement: Root element of the parsed document.
+    """
+    return html.fromstring(page_source)
+
+
+def _text(node):
+    """
+    Returns the visible text of a node, mirroring what Selenium's `.text` gives back.
+    """
+    parts = []
+    for text in node.xpath(".//text()[not(ancestor::*[contains(@class, 'visually-hidden')])]"):
+        parts.append(text)
+    lines = (_WHITESPACE.sub(" ", line).strip() for line in "".join(parts).splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+def _first(xpath, node):
+    """
+    Returns the text of the first match of a compiled XPath, or None when nothing matches.
+    """
+    found = xpath(node)
+    if not found:
+        return None
+    return _text(found[0])
+
+
+def parse_profile(tree):
+    """
+    Extracts the top card fields from the main profile page.
+
+    Args:
+        tree (lxml.html.HtmlElement): Parsed main profile page.
+
+    Returns:
+        dict: `Name`, `Title`, `Location` and `About`; missing fields are empty strings.
+    """
+    return {
+        "Name": _first(_PROFILE_NAME, tree) or "",
+        "Title": _first(_PROFILE_TITLE, tree) or "",
+        "Location": _first(_PROFILE_LOCATION, tree) or "",
+        "About": _first(_PROFILE_ABOUT, tree) or "",
+    }
+
+
+def parse_contact_info(tree):
+    """
+    Extracts contact information from the contact info overlay.
+
+    Args:
+        tree (lxml.html.HtmlElement): Parsed contact info page.
+
+    Returns:
+        dict: Mapping of section heading to its content.
+    """
+    contact_info = {}
+    for section in _CONTACT_SECTIONS(tree):
+        heading = _first(_CONTACT_HEADING, section)
+        if heading is None:
+            break
+        if 'profile' in heading.lower().strip().split():
+            continue
+
+        content = ""
+        for xpath in _CONTACT_CONTENT:
+            found = _first(xpath, section)
+            if found is not None:
+                content = found
+                break
+        contact_info[f'{heading}'] = content
+    return contact_info
+
+
+def parse_education(tree):
+    """
+    Extracts educational history from the education details page.
+
+    Args:
+        tree (lxml.html.HtmlElement): Parsed education details page.
+
+    Returns:
+        list: List of dicts with `Institute` and `Qualification` keys.
+    """
+    tempEducation = []
+    for entry in _EDUCATION_ENTRIES(tree):
+        temp = {}
+        temp["Institute"] = _first(_EDUCATION_SCHOOL, entry)
+        temp["Qualification"] = _first(_EDUCATION_DEGREE, entry) or ""
+        tempEducation.append(temp)
+    return tempEducation
+
+
+def subreader(entry, tempDetail):
+    """
+    Extracts the skills of every role nested under a grouped experience entry.
+
+    Args:
+        entry (lxml.html.HtmlElement): The grouped experience `li` element.
+        tempDetail (dict): Experience entry to append skills into.
+    """
+    temp = []
+    for skill in _GROUP_SKILLS(entry):
+        text = _text(skill)
+        if ":" in text:
+            temp.append(text.split(":")[1].split("·"))
+    tempDetail["skill"] = temp
+
+
+def parse_experience(tree):
+    """
+    Extracts professional experience from the experience details page.
+
+    Args:
+        tree (lxml.html.HtmlElement): Parsed experience details page.
+
+    Returns:
+        list: List of experience dicts with `role`, `company`, `year` (duration), `dates` (date range)
+            and `skill` keys; entries grouping several roles have no `role` and `dates`.
+    """
+    personExpDetails = []
+    for entry in _EXPERIENCE_ENTRIES(tree):
+        tempDetail = {}
+        role = _first(_EXPERIENCE_ROLE, entry)
+        company = _first(_EXPERIENCE_COMPANY, entry)
+        year = _first(_EXPERIENCE_YEAR, entry)
+
+        if role is not None and company is not None and year is not None and "·" in year:
+            tempDetail["role"] = role
+            tempDetail["company"] = company.split("·")[0]
+            tempDetail["year"] = year.split("·")[1]
+            tempDetail["dates"] = year.split("·")[0].strip()
+            skill = _first(_EXPERIENCE_SKILL, entry)
+            if skill is not None and ":" in skill:
+                tempDetail["skill"] = skill.split(":")[1].split("·")
+        else:
+            company = _first(_GROUP_COMPANY, entry)
+            year = _first(_GROUP_YEAR, entry)
+            if company is None or year is None or "·" not in year:
+                break
+            tempDetail["company"] = company.split("·")[0]
+            tempDetail["year"] = year.split("·")[1]
+            subreader(entry, tempDetail)
+        personExpDetails.append(tempDetail)
+    return personExpDetails
+
+
+def exp_count(entries):
+    """
+    Calculates total professional experience from a list of duration strings.
+
+    Args:
+        entries (list): List of strings containing experience durations.
+
+    Returns:
+        str: Total experience in years and months.
+    """
+    total_months = 0
+    for entry in entries:
+
+        years = re.search(r'(\d+)\s*yrs?', entry)
+        months = re.search(r'(\d+)\s*mos?', entry)
+
+        year_val = int(years.group(1)) if years else 0
+        month_val = int(months.group(1)) if months else 0
+
+        total_months += year_val * 12 + month_val
+    total_years = total_months // 12
+    remaining_months = total_months % 12
+    return f"{total_years} yrs {remaining_months} mos"
+
+
+def canonical_url(tree):
+    """
+    Returns the URL a saved page declares for itself (canonical link or `og:url`), or None.
+    """
+    found = _CANONICAL(tree)
+    return found[0].strip() if found else None
+
+
+def detect_section(tree):
+    """
+    Tells which page of a profile a saved page is: from the URL it declares, otherwise
+    from which selectors find entries in it.
+
+    Args:
+        tree (lxml.html.HtmlElement): Parsed page.
+
+    Returns:
+        str: "Profile" for the main page, a section of `navigation.PAGES`, or None if unknown.
+    """
+    url = canonical_url(tree)
+    if url:
+        for section, path in PAGES.items():
+            if path in url:
+                return section
+        if "/in/" in url:
+            return "Profile"
+    if parse_contact_info(tree):
+        return "Contact_info"
+    if parse_experience(tree):
+        return "Experience"
+    if _EDUCATION_ENTRIES(tree):
+        return "Education"
+    if _PROFILE_NAME(tree):
+        return "Profile"
+    return None
+
+
+def _tree(page):
+    return parse(page) if isinstance(page, (str, bytes)) else page
+
+
+def extract_profile(pages, link=None):
+    """
+    Builds a profile from the HTML of its pages, without a browser. Sections whose page
+    is missing are left out, as when the scraper is told not to read them.
+
+    Args:
+        pages (dict): Section name ("Profile" for the main page, "Contact_info", "Education",
+            "Experience") to the page's HTML or parsed tree.
+        link (str): Profile URL.
+
+    Returns:
+        tuple: The profile dictionary in the scraper's shape and the About text.
+    """
+    personeDetails = {"Profile Link": link}
+    about = ""
+    if "Profile" in pages:
+        top = parse_profile(_tree(pages["Profile"]))
+        about = top["About"]
+        personeDetails["Title"] = top["Title"]
+        personeDetails["Name"] = top["Name"]
+        personeDetails["Location"] = top["Location"]
+        personeDetails["Fingerprint"] = fingerprint(top["Name"], top["Title"], top["Location"], about)
+    if "Contact_info" in pages:
+        personeDetails["Contact_info"] = parse_contact_info(_tree(pages["Contact_info"]))
+    if "Education" in pages:
+        personeDetails["Education"] = parse_education(_tree(pages["Education"]))
+    if "Experience" in pages:
+        personExpDetails = parse_experience(_tree(pages["Experience"]))
+        personeDetails["Total_Experiance"] = exp_count([detail["year"] for detail in personExpDetails])
+        personeDetails["Experience"] = personExpDetails
+    return personeDetails, about
@@ -0,0 +1,96 @@
+"""
+URL frontier for the LinkedIn Scraper.
+
+The frontier is the work queue between link harvesting and the profile reader.
+Every URL is normalized before it is admitted, each profile is admitted once,
+and each one carries a state (pending, in progress, done, failed), so a run over
+N targets costs exactly N profile visits.
+"""
+
+from collections import deque
+from utils import normalize_url
+
+
+PENDING = "pending"
+IN_PROGRESS = "in-progress"
+DONE = "done"
+FAILED = "failed"
+
+
+class Frontier:
+    """
+    Deduplicating work queue of profile URLs with per-URL state.
+
+    Attributes:
+        limit (int): Maximum number of URLs admitted, or None for no limit.
+        states (dict): State of every admitted URL, in admission order.
+    """
+
+    def __init__(self, urls=(), limit=None):
+        self.limit = limit
+        self.states = {}
+        self.queue = deque()
+        for url in urls:
+            self.add(url)
+
+    def __len__(self):
+        return len(self.states)
+
+    def __contains__(self, url):
+        return normalize_url(url) in self.states
+
+    def full(self):
+        """
+        Returns True once `limit` URLs have been admitted.
+        """
+        return self.limit is not None and len(self.states) >= self.limit
+
+    def add(self, url):
+        """
+        Admits a URL unless it was seen before or the frontier is full.
+
+        Args:
+            url (str): Profile URL, in any form found on the page.
+
+        Returns:
+            bool: True if the URL was new and admitted.
+        """
+        url = normalize_url(url)
+        if url in self.states or self.full():
+            return False
+        self.states[url] = PENDING
+        self.queue.append(url)
+        return True
+
+    def __iter__(self):
+        """
+        Hands out every pending URL exactly once, marking it in progress.
+        """
+        while self.queue:
+            url = self.queue.popleft()
+            if self.states[url] != PENDING:
+                continue
+            self.states[url] = IN_PROGRESS
+            yield url
+
+    def mark(self, url, state):
+        """
+        Records the outcome of a URL.
+
+        Args:
+            url (str): Normalized profile URL handed out by the frontier.
+            state (str): One of `DONE` or `FAILED`.
+        """
+        self.states[url] = state
+
+    def counts(self):
+        """
+        Returns the number of URLs in each state.
+
+        Returns:
+            dict: Count per state.
+        """
+        counts = {PENDING: 0, IN_PROGRESS: 0, DONE: 0, FAILED: 0}
+        for state in self.states.values():
+            counts[state] += 1
+        return counts
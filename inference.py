@@ -0,0 +1,259 @@
+"""
+Background competency inference for the LinkedIn Scraper.
+
+`CompetencyPipeline` runs the competency lookups on a small thread pool so the
+browser can move on to the next profile while the AI round-trip completes. The
+number of profiles waiting for inference is bounded, and failed calls are
+retried with exponential backoff. `CompetencyBatcher` packs the concurrent
+requests into one model call per batch.
+"""
+
+import itertools
+import json
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+import config
+
+
+class CompetencyPipeline:
+    """
+    Bounded, retrying thread pool for competency inference.
+
+    Attributes:
+        func (callable): Function computing the competency, called as `func(about, experience, title)`.
+        retries (int): Number of retries after a failed call.
+        backoff (float): Base delay in seconds of the exponential backoff.
+        executor (ThreadPoolExecutor): Worker pool.
+    """
+
+    def __init__(self, func, workers=config.AI_WORKERS, max_pending=config.AI_MAX_PENDING,
+                 retries=config.AI_RETRIES, backoff=config.AI_BACKOFF):
+        self.func = func
+        self.retries = retries
+        self.backoff = backoff
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="competancy")
+        self.slots = threading.BoundedSemaphore(max_pending)
+
+    def _call(self, *args):
+        for attempt in range(self.retries + 1):
+            try:
+                return self.func(*args)
+            except Exception as e:
+                if attempt == self.retries:
+                    raise
+                time.sleep(self.backoff * (2 ** attempt) * random.uniform(1, 1.5))
+
+    def submit(self, about, experience, title):
+        """
+        Queues a competency lookup. Blocks while the maximum number of lookups is pending.
+
+        Args:
+            about (str): About section text.
+            experience (list): List of experience dicts.
+            title (str): Profile headline.
+
+        Returns:
+            Future: Resolves to the competency string.
+        """
+        self.slots.acquire()
+        future = self.executor.submit(self._call, about, experience, title)
+        future.add_done_callback(lambda future: self.slots.release())
+        return future
+
+    def close(self):
+        """
+        Waits for the pending lookups and stops the workers.
+        """
+        self.executor.shutdown(wait=True)
+
+
+BATCH_PROMPT = ("For each profile in the JSON list below, tell the area of expertise and the programming language "
+                "the person uses the most; if it cannot be determined, give the most relevant programming language "
+                "according to the data. Reply in 2-3 words per profile. Answer with a JSON array only, one object "
+                "per profile: [{\"id\": \"<profile id>\", \"competency\": \"<2-3 words>\"}].\n")
+
+
+def _trim(text, limit):
+    text = " ".join(str(text or "").split())
+    return text if len(text) <= limit else text[:limit].rsplit(" ", 1)[0]
+
+
+def _summary(experience, limit):
+    """
+    Condenses experience entries to "role at company (duration): skills" lines for a batch request.
+    """
+    lines = []
+    for entry in experience or []:
+        skills = []
+        for skill in entry.get("skill", []):
+            skills.extend(skill if isinstance(skill, list) else [skill])
+        line = f"{entry.get('role', '')} at {entry.get('company', '')} ({entry.get('year', '')})"
+        if skills:
+            line += ": " + ", ".join(skill.strip() for skill in skills)
+        lines.append(line)
+    return _trim("; ".join(lines), limit)
+
+
+def _tokens(text):
+    """
+    Rough token estimate of a text (about four characters per token).
+    """
+    return len(text) // 4 + 1
+
+
+def parse_batch(text):
+    """
+    Parses and validates the answer to a batch request.
+
+    Args:
+        text (str): Model reply, optionally wrapped in a Markdown code fence.
+
+    Returns:
+        dict: Competency by profile ID; malformed entries are left out.
+    """
+    text = text.strip()
+    if text.startswith("```"):
+        text = text.strip("`")
+        text = text[text.find("["):] if "[" in text else text
+    try:
+        answers = json.loads(text)
+    except ValueError:
+        return {}
+    if not isinstance(answers, list):
+        return {}
+    valid = {}
+    for answer in answers:
+        if isinstance(answer, dict) and isinstance(answer.get("id"), str) \
+                and isinstance(answer.get("competency"), str) and answer["competency"].strip():
+            valid[answer["id"]] = answer["competency"].strip()
+    return valid
+
+
+class CompetencyBatcher:
+    """
+    Packs concurrent competency requests into one model call per batch.
+
+    Callers block in `infer()` as with a single request. A dispatcher thread collects up to
+    `batch_size` requests, or what arrived within `linger` seconds of the oldest one, without
+    going over `token_budget`, and asks for a JSON array keyed by profile ID. Profiles missing
+    from a valid answer, or every profile when the answer cannot be parsed, are split off and
+    requested again; a single profile falls back to the plain one-profile prompt. When the
+    backend call itself fails (bad key, quota, network), the error goes to every caller of the
+    batch, whose pipeline retries it, instead of being split into more calls. `flush()` sends
+    the waiting requests without lingering, e.g. when the run waits for the last competencies.
+
+    Attributes:
+        backend: Object with a `generate(prompt)` method.
+        fallback (callable): Single-profile request, called as `fallback(title, experience, about)`.
+        batch_size (int): Maximum number of profiles per request.
+        token_budget (int): Maximum estimated prompt tokens per request.
+        linger (float): Longest time in seconds a request waits for the batch to fill.
+        requests (int): Number of model calls made.
+    """
+
+    def __init__(self, backend, fallback, batch_size=config.AI_BATCH_SIZE, token_budget=config.AI_BATCH_TOKENS,
+                 linger=config.AI_BATCH_LINGER):
+        self.backend = backend
+        self.fallback = fallback
+        self.batch_size = batch_size
+        self.token_budget = token_budget
+        self.linger = linger
+        self.requests = 0
+        self.queue = []
+        self.condition = threading.Condition()
+        self.ids = itertools.count(1)
+        self.thread = None
+        self.flushing = False
+
+    def infer(self, title, experience, about):
+        """
+        Requests the competency of one profile as part of the next batch.
+
+        Returns:
+            str: The competency.
+        """
+        profile = {
+            "id": f"p{next(self.ids)}",
+            "title": _trim(title, config.AI_BATCH_ITEM_CHARS),
+            "experience": _summary(experience, config.AI_BATCH_ITEM_CHARS),
+            "about": _trim(about, config.AI_BATCH_ITEM_CHARS),
+        }
+        item = {"profile": profile, "args": (title, experience, about), "future": Future(),
+                "tokens": _tokens(json.dumps(profile)), "since": time.monotonic()}
+        with self.condition:
+            self.queue.append(item)
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run, name="competancy-batcher", daemon=True)
+                self.thread.start()
+            self.condition.notify()
+        return item["future"].result()
+
+    def flush(self):
+        """
+        Sends the waiting requests right away instead of waiting for their batch to fill.
+        """
+        with self.condition:
+            self.flushing = True
+            self.condition.notify()
+
+    def _full(self):
+        return len(self.queue) >= self.batch_size or \
+            _tokens(BATCH_PROMPT) + sum(item["tokens"] for item in self.queue) >= self.token_budget
+
+    def _take(self):
+        batch = []
+        tokens = _tokens(BATCH_PROMPT)
+        while self.queue and len(batch) < self.batch_size:
+            if batch and tokens + self.queue[0]["tokens"] > self.token_budget:
+                break
+            item = self.queue.pop(0)
+            tokens += item["tokens"]
+            batch.append(item)
+        return batch
+
+    def _run(self):
+        while True:
+            with self.condition:
+                while not self.queue:
+                    self.condition.wait()
+                deadline = self.queue[0]["since"] + self.linger
+                while not self._full() and not self.flushing and time.monotonic() < deadline:
+                    self.condition.wait(deadline - time.monotonic())
+                batch = self._take()
+                if not self.queue:
+                    self.flushing = False
+            self._send(batch)
+
+    def _send(self, batch):
+        if len(batch) == 1:
+            item = batch[0]
+            try:
+                self.requests += 1
+                item["future"].set_result(self.fallback(*item["args"]))
+            except Exception as e:
+                item["future"].set_exception(e)
+            return
+
+        try:
+            self.requests += 1
+            text = self.backend.generate(BATCH_PROMPT + json.dumps([item["profile"] for item in batch]))
+        except Exception as e:
+            print(f"Batch competency request failed for {len(batch)} profiles: {e}")
+            for item in batch:
+                item["future"].set_exception(e)
+            return
+        answers = parse_batch(text)
+        failed = []
+        for item in batch:
+            competency = answers.get(item["profile"]["id"])
+            if competency is None:
+                failed.append(item)
+            else:
+                item["future"].set_result(competency)
+
+        middle = (len(failed) + 1) // 2
+        for part in (failed[:middle], failed[middle:]):
+            if part:
+                self._send(part)
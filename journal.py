@@ -0,0 +1,106 @@
+"""
+Crash-safe result journal for the LinkedIn Scraper.
+
+Every completed profile is appended to a JSON Lines file and fsynced before the
+scraper moves on, so a crash or Ctrl-C never loses finished profiles. The final
+exports are streamed from it, and once they are written the journal is marked
+complete (renamed to `<journal>.done`). A journal that is still open belongs to
+an interrupted run: re-running the same company and search query reopens it and
+skips the profiles it already contains.
+"""
+
+import json
+import os
+import re
+import config
+
+
+def journal_path(company, search_query, directory=config.JOURNAL_DIR):
+    """
+    Returns the journal file used for a company and search query.
+
+    Args:
+        company (str): Target company name.
+        search_query (str): Search keyword.
+        directory (str): Directory the journals are kept in.
+
+    Returns:
+        str: Path of the journal file.
+    """
+    name = re.sub(r"[^\w.-]+", "_", f"{company}_{search_query}".strip().lower())
+    return os.path.join(directory, f"{name}.jsonl")
+
+
+class ProfileJournal:
+    """
+    Append-only JSON Lines journal of scraped profiles.
+
+    Attributes:
+        path (str): Path of the journal file.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._repair()
+
+    def _repair(self):
+        """
+        Drops a trailing line left half written by a crash, so new entries start on a fresh line.
+        """
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "rb+") as file:
+            data = file.read()
+            if data and not data.endswith(b"\n"):
+                file.truncate(data.rfind(b"\n") + 1)
+
+    def entries(self):
+        """
+        Streams the journal lines one at a time. A line left half written by a crash is skipped.
+        """
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, encoding="utf-8") as file:
+            for line in file:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
+
+    def __iter__(self):
+        """
+        Streams every journaled profile once, as last appended. The journal is read twice: first to
+        find the last entry of every profile, then to yield those entries, so memory does not grow
+        with the profiles' data.
+        """
+        last = {}
+        for number, profile in enumerate(self.entries()):
+            last[profile.get("Profile Link")] = number
+        keep = set(last.values())
+        del last
+        for number, profile in enumerate(self.entries()):
+            if number in keep:
+                yield profile
+
+    def complete(self):
+        """
+        Marks the run finished once its exports are written, so the next run starts a fresh journal.
+        The journal is kept as `<path>.done`, replacing the one of the previous finished run.
+        """
+        if os.path.exists(self.path):
+            os.replace(self.path, self.path + ".done")
+
+    def append(self, profile):
+        """
+        Appends a profile and forces it to disk. Appending a profile again replaces its earlier entry.
+
+        Args:
+            profile (dict): Scraped profile data.
+        """
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write(json.dumps(profile, ensure_ascii=False) + "\n")
+            file.flush()
+            os.fsync(file.fileno())
@@ -7,7 +7,8 @@ os.system("clear")
 print("====================== WELCOME TO LINKED IN SCRAPPER =====================================\n\n\n")
 
 scraper.COOKIE_FILE = config.COOKIE_FILE
-if not os.path.exists(config.COOKIE_FILE):
+scraper.session.legacy_file = config.COOKIE_FILE
+if not scraper.session.saved():
     scraper.email = input("Enter your LinkedIn email: ")
     scraper.password = input("Enter your LinkedIn password: ")
 
@@ -0,0 +1,145 @@
+"""
+Row schema of the CSV and Parquet exports of the LinkedIn Scraper.
+
+Profiles travel through the scraper, the journal, the profile store and the JSON
+exports as plain dicts in the historical shape (`Profile Link`,
+`Total_Experiance`, `Competancy`, ...). These slotted dataclasses are only the
+schema of the CSV and Parquet rows: `from_dict()` reads a profile dict once, and
+the record produces the flattened CSV row and the Parquet row. They are never
+turned back into dicts.
+"""
+
+from dataclasses import dataclass, field
+
+
+@dataclass(slots=True)
+class ContactInfo:
+    """
+    Contact info overlay: section heading (Email, Phone, ...) to its content.
+    """
+
+    entries: dict = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(dict(data))
+
+
+@dataclass(slots=True)
+class EducationEntry:
+    institute: str = None
+    qualification: str = ""
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data.get("Institute"), data.get("Qualification", ""))
+
+
+@dataclass(slots=True)
+class ExperienceEntry:
+    """
+    One experience entry. `skill_groups` holds the raw skill lists, one per role; an entry
+    that groups several roles under one company has no role or date range.
+    """
+
+    company: str = None
+    year: str = None
+    role: str = None
+    dates: str = None
+    skill_groups: list = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data):
+        skill = data.get("skill")
+        if skill is None:
+            groups = []
+        elif "role" not in data or (skill and isinstance(skill[0], list)):
+            groups = [list(group) for group in skill]
+        else:
+            groups = [list(skill)]
+        return cls(data.get("company"), data.get("year"), data.get("role"), data.get("dates"), groups)
+
+    @property
+    def skills(self):
+        """
+        Every skill of the entry, stripped, in one flat list.
+        """
+        return [skill.strip() for group in self.skill_groups for skill in group if skill.strip()]
+
+
+@dataclass(slots=True)
+class Profile:
+    """
+    A scraped profile. Sections that were not scraped are None and export as empty.
+    `fingerprint` identifies the top card (see `refresh.fingerprint`).
+    """
+
+    link: str = None
+    name: str = None
+    title: str = None
+    location: str = None
+    contact_info: ContactInfo = None
+    education: list = None
+    total_experience: str = None
+    experience: list = None
+    competency: str = None
+    fingerprint: str = None
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Builds a record from a profile dict in the scraper's shape.
+        """
+        contact_info = data.get("Contact_info")
+        education = data.get("Education")
+        experience = data.get("Experience")
+        return cls(
+            link=data.get("Profile Link"),
+            name=data.get("Name"),
+            title=data.get("Title"),
+            location=data.get("Location"),
+            contact_info=ContactInfo.from_dict(contact_info) if contact_info is not None else None,
+            education=[EducationEntry.from_dict(entry) for entry in education] if education is not None else None,
+            total_experience=data.get("Total_Experiance"),
+            experience=[ExperienceEntry.from_dict(entry) for entry in experience] if experience is not None else None,
+            competency=data.get("Competancy"),
+            fingerprint=data.get("Fingerprint"),
+        )
+
+    def csv_row(self):
+        """
+        Flattens the profile into one CSV row keyed by `export.CSV_FIELDS`.
+        """
+        return {
+            "Name": self.name,
+            "Profile Link": self.link,
+            "Location": self.location,
+            "Total Experience": self.total_experience,
+            "Competency": self.competency,
+            "Title": self.title,
+            "Education": "; ".join(f"{entry.institute}: {entry.qualification}" for entry in self.education or []),
+            "Experience": "; ".join(f"{entry.role} at {entry.company} ({entry.year})"
+                                    for entry in self.experience or []),
+            "Contact_info": "; ".join(f"{key}: {value}"
+                                      for key, value in (self.contact_info.entries if self.contact_info else {}).items()),
+        }
+
+    def parquet_row(self):
+        """
+        Returns the profile as a row of the Parquet schema, skills flattened per experience entry.
+        """
+        return {
+            "Name": self.name,
+            "Profile Link": self.link,
+            "Title": self.title,
+            "Location": self.location,
+            "Total_Experiance": self.total_experience,
+            "Competancy": self.competency,
+            "Contact_info": [{"key": key, "value": value}
+                             for key, value in (self.contact_info.entries if self.contact_info else {}).items()],
+            "Education": [{"Institute": entry.institute, "Qualification": entry.qualification}
+                          for entry in self.education or []],
+            "Experience": [{"role": entry.role, "company": entry.company, "year": entry.year, "dates": entry.dates,
+                            "skill": entry.skills} for entry in self.experience or []],
+            "Fingerprint": self.fingerprint,
+        }
@@ -0,0 +1,38 @@
+"""
+Per-profile navigation plan for the LinkedIn Scraper.
+
+Every detail section of a profile has its own URL, so a profile is read by
+loading its main page once and then each requested section's page directly, in
+a fixed order. Nothing is scrolled into view and nothing navigates back: the
+next page load replaces the page anyway.
+"""
+
+import config
+
+
+# Detail sections in visiting order, with the path appended to the profile URL.
+PAGES = {
+    "Contact_info": "/overlay/contact-info",
+    "Education": "/details/education",
+    "Experience": "/details/experience",
+}
+
+
+def plan(profile_url, sections=config.SECTIONS):
+    """
+    Lists the pages to visit after the main profile page.
+
+    Args:
+        profile_url (str): Normalized profile URL.
+        sections (iterable): Requested detail sections, see `PAGES`.
+
+    Returns:
+        list: `(section, url)` pairs in visiting order.
+
+    Raises:
+        ValueError: If a section is unknown.
+    """
+    unknown = set(sections) - set(PAGES)
+    if unknown:
+        raise ValueError("Unknown profile sections: " + ", ".join(sorted(unknown)))
+    return [(section, profile_url + path) for section, path in PAGES.items() if section in sections]
@@ -0,0 +1,125 @@
+"""
+Readiness-driven pacing for the LinkedIn Scraper.
+
+Instead of sleeping a fixed, import-time sampled delay after every step, the
+scraper asks a `Pacer` for permission before each request and, after the
+request, waits only until the page is ready. The request rate is capped by a
+token bucket and a minimum gap between requests, with the jitter re-sampled on
+every call.
+"""
+
+import random
+import time
+import config
+import tracing
+
+
+class Pacer:
+    """
+    Token-bucket request scheduler with readiness-based settling.
+
+    Attributes:
+        rate (float): Tokens added to the bucket per second.
+        capacity (float): Maximum number of tokens the bucket holds.
+        min_gap (float): Minimum number of seconds between two requests.
+        jitter_range (tuple): Bounds of the random jitter added to the minimum gap.
+        tokens (float): Tokens currently in the bucket.
+        slept (float): Total seconds spent sleeping for pacing.
+        waited (float): Total seconds spent waiting for pages to become ready.
+    """
+
+    def __init__(self, rpm=config.REQUESTS_PER_MINUTE, burst=config.REQUEST_BURST, min_gap=config.MIN_GAP,
+                 jitter=config.JITTER):
+        self.rate = rpm / 60
+        self.capacity = burst
+        self.min_gap = min_gap
+        self.jitter_range = jitter
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.last_request = None
+        self.slept = 0.0
+        self.waited = 0.0
+
+    def jitter(self, name=None):
+        """
+        Samples a fresh delay.
+
+        Args:
+            name (str): Key in `config.DELAYS`; the global jitter range is used when omitted.
+
+        Returns:
+            float: Delay in seconds.
+        """
+        low, high = config.DELAYS[name] if name else self.jitter_range
+        return random.uniform(low, high)
+
+    def sleep(self, seconds):
+        """
+        Sleeps and accounts the time as pacing sleep.
+        """
+        if seconds > 0:
+            time.sleep(seconds)
+            self.slept += seconds
+            tracing.record("sleep_s", seconds)
+
+    def dwell(self, name):
+        """
+        Sleeps a freshly sampled delay for steps that have no readiness condition (scroll animations, typing).
+
+        Args:
+            name (str): Key in `config.DELAYS`.
+        """
+        self.sleep(self.jitter(name))
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def throttle(self):
+        """
+        Blocks until the next request is allowed by the token bucket and the minimum gap.
+        Must be called right before every request (page load, navigating click, search).
+        """
+        self._refill()
+        if self.tokens < 1:
+            self.sleep((1 - self.tokens) / self.rate)
+            self._refill()
+        if self.last_request is not None:
+            gap = self.min_gap + self.jitter()
+            self.sleep(gap - (time.monotonic() - self.last_request))
+            self._refill()
+        self.tokens -= 1
+        self.last_request = time.monotonic()
+
+    def settle(self, driver, name, locator=None):
+        """
+        Waits until the document is loaded and, if given, the target element is present.
+        The upper bound of `config.DELAYS[name]` is the longest this waits.
+
+        Args:
+            driver (Firefox): Browser instance.
+            name (str): Key in `config.DELAYS`.
+            locator (tuple): Optional `(By, value)` locator of the target section.
+
+        Returns:
+            bool: True if the page became ready, False if the wait ran out.
+        """
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        def ready(driver):
+            if driver.execute_script("return document.readyState") != "complete":
+                return False
+            return locator is None or len(driver.find_elements(*locator)) > 0
+
+        start = time.monotonic()
+        try:
+            WebDriverWait(driver, config.DELAYS[name][1], poll_frequency=config.READY_POLL).until(ready)
+            return True
+        except TimeoutException:
+            return False
+        finally:
+            elapsed = time.monotonic() - start
+            self.waited += elapsed
+            tracing.record("wait_s", elapsed)
@@ -0,0 +1,104 @@
+"""
+Delta refresh for the LinkedIn Scraper.
+
+Refreshing a previous run reloads only each profile's main page and fingerprints
+its top card (Name, Title, Location, About). When the fingerprint matches the one
+stored with the previous record, the detail pages are not visited and the old
+data is carried forward; otherwise the profile is scraped again in full. Every
+profile gets a diff entry: added, changed, unchanged or failed.
+
+Usage:
+    python refresh.py <previous .json/.jsonl.gz export or journal> [--harvest --company Google --query Java --number 20]
+"""
+
+import argparse
+import hashlib
+import re
+
+
+ADDED = "added"
+CHANGED = "changed"
+UNCHANGED = "unchanged"
+FAILED = "failed"
+
+# Keys compared when listing what changed; the fingerprint and the competency are derived from them.
+DIFF_KEYS = ("Name", "Title", "Location", "Contact_info", "Education", "Total_Experiance", "Experience")
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def fingerprint(name, title, location, about):
+    """
+    Hashes the top card fields of a profile, ignoring case and whitespace differences.
+
+    Returns:
+        str: Hex digest.
+    """
+    text = "\x1f".join(_WHITESPACE.sub(" ", value or "").strip().lower() for value in (name, title, location, about))
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:32]
+
+
+def diff(previous, current):
+    """
+    Describes how a profile changed between two runs.
+
+    Args:
+        previous (dict): Profile from the previous run, or None if it is new.
+        current (dict): Profile from this run.
+
+    Returns:
+        dict: Diff entry with the profile link, name, status and the changed keys.
+    """
+    entry = {"Profile Link": current["Profile Link"], "Name": current.get("Name", "")}
+    if previous is None:
+        entry.update(status=ADDED, fields=[key for key in DIFF_KEYS if key in current])
+        return entry
+    fields = [key for key in DIFF_KEYS if key in current and current.get(key) != previous.get(key)]
+    entry.update(status=CHANGED if fields else UNCHANGED, fields=fields)
+    return entry
+
+
+def failure(link, name=""):
+    """
+    Diff entry for a profile that could not be refreshed.
+    """
+    return {"Profile Link": link, "Name": name, "status": FAILED, "fields": []}
+
+
+def summarize(entries):
+    """
+    Counts the diff entries per status.
+
+    Returns:
+        dict: Status to number of profiles.
+    """
+    counts = dict.fromkeys((ADDED, CHANGED, UNCHANGED, FAILED), 0)
+    for entry in entries:
+        counts[entry["status"]] += 1
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("previous", help="Previous export (.json, .jsonl.gz) or journal")
+    parser.add_argument("--harvest", action="store_true", help="Also search again and add new profiles")
+    parser.add_argument("--company", default="")
+    parser.add_argument("--query", default="")
+    parser.add_argument("--number", type=int, default=None)
+    args = parser.parse_args()
+
+    from scraper import LinkedInScraper
+
+    scraper = LinkedInScraper()
+    scraper.company = args.company
+    scraper.search_query = args.query
+    scraper.number = args.number
+    try:
+        scraper.start()
+        scraper.refresh(args.previous, harvest=args.harvest)
+    finally:
+        scraper.close()
+
+
+if __name__ == "__main__":
+    main()
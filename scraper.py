@@ -1,20 +1,73 @@
 
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions 
-from selenium.webdriver.firefox.service import Service
-import pandas as pd
-from utils import AIdata
+from utils import AIdata, flush_batch
+import extractor
+from waits import SelectorWait
+from pacing import Pacer
+from journal import ProfileJournal, journal_path
+from store import ProfileStore
+from frontier import Frontier, DONE, FAILED
+from navigation import plan
+from refresh import fingerprint, diff, failure, summarize
+from utils import normalize_url
+from inference import CompetencyPipeline
+from cache import CompetencyCache, cache_key
+from export import export as export_profiles, read as read_profiles, run_id
+from tracing import Tracer, instrument, traced
+from session import SessionManager, FEED_URL
+from archive import PageArchive
 import config
-import json
-import time
-import pickle
 import os
+import json
+from urllib.parse import urlparse
 import logging
-import re
-import datetime
+
+SEARCH_BAR = '/html/body/div[6]/header/div/div/div/div[1]/input'
+
+# Link of every loaded card on the company people page; cards without a link (out of network) are skipped.
+PEOPLE_CARDS = "[id^='org-people-profile-card__profile-image-']"
+HARVEST_LINKS = "return Array.from(document.querySelectorAll(arguments[0]), card => card.href).filter(Boolean);"
+# "Show more results" button below the loaded cards.
+LOAD_MORE = "/html/body/div[6]/div[3]/div/div[2]/div/div[2]/main/div[2]/div/div/div[2]/div/div[2]/div/button"
+# Clicks on "load more" in a row that may bring no new links before harvesting stops.
+HARVEST_STALE_ROUNDS = 2
+
+# Eased scroll to the bottom of the page, run in the browser by `LinkedInScraper.scroll()`.
+# Arguments: animation duration, idle time and maximum wait for new content, all in milliseconds.
+SMOOTH_SCROLL = """
+const [duration, idle, maxWait, done] = arguments;
+const startY = window.pageYOffset;
+const startHeight = document.body.scrollHeight;
+const began = performance.now();
+const ease = t => t < 0.5 ? 2 * t * t : 1 - Math.pow(-2 * t + 2, 2) / 2;
+
+function settle() {
+    let last = document.body.scrollHeight;
+    let stable = performance.now();
+    const watch = setInterval(() => {
+        const height = document.body.scrollHeight;
+        if (height !== last) {
+            last = height;
+            stable = performance.now();
+            window.scrollTo(0, height);
+        }
+        if (performance.now() - stable >= idle || performance.now() - began >= duration + maxWait) {
+            clearInterval(watch);
+            done({grew: height > startHeight, height: height});
+        }
+    }, 100);
+}
+
+function step(now) {
+    const t = Math.min(1, (now - began) / duration);
+    window.scrollTo(0, startY + (document.body.scrollHeight - startY) * ease(t));
+    if (t < 1) {
+        requestAnimationFrame(step);
+    } else {
+        settle();
+    }
+}
+requestAnimationFrame(step);
+"""
 
 # logging.basicConfig(filemode='logfile.log', level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
 class NotEnoughNetworkException(Exception):
@@ -36,29 +89,55 @@ class LinkedInScraper:
 
     Attributes:
         service (Service): Selenium service object to manage the Firefox WebDriver.
-        driver (Firefox): The main browser instance used for automation.
-        wait (WebDriverWait): WebDriverWait object to handle dynamic loading elements.
-        COOKIE_FILE (str): File path for storing and retrieving session cookies.
+        driver (Firefox): The main browser instance used for automation, started lazily on first access.
+        waits (SelectorWait): Instrumented wait layer used for every element lookup.
+        pacer (Pacer): Request scheduler that enforces the rate limits and waits for pages to become ready.
+        tracer (Tracer): Collects the timing spans of the run.
+        store (ProfileStore): Cross-run profile store used to skip profiles scraped within the TTL.
+        cache (CompetencyCache): Memoization cache of AI competency results.
+        pipeline (CompetencyPipeline): Background workers that infer competencies while browsing continues.
+        session (SessionManager): Checks, restores and saves the signed-in session.
+        archive (PageArchive): Records the HTML of every page read, or None (see `config.ARCHIVE_DIR`).
+        COOKIE_FILE (str): Legacy pickle cookie file, read when no session file exists yet.
         email (str): LinkedIn email address (should be set before calling `login`).
         password (str): LinkedIn password (should be set before calling `login`).
         company (str): Target company name for scraping employees.
         search_query (str): Skill or keyword to filter employee search results.
         number (str): Number of employee profiles to scrape.
+        sections (list): Detail sections read for every profile (see `navigation.PAGES`).
+        run_id (str): ID shared by all output files of the current run.
 
     Methods:
+        quit(): Closes the browser if it was started.
+        browser_options(): Builds the Firefox options (headless, lean mode, profile directory) from `config.py`.
+        maximize(): Maximizes the window unless lean mode is on.
         exp_count(entries): Converts a list of duration strings (e.g., "2 yrs 3 mos") into total experience.
-        save_cookies(): Saves the current session cookies to a file to enable session persistence.
-        load_cookies(): Loads previously saved cookies into the browser session.
+        save_cookies(): Saves the current session cookies to the session file to enable session persistence.
+        load_cookies(): Loads previously saved cookies into the browser session and checks the session.
         login(): Logs into LinkedIn using provided credentials and saves the session cookies.
         get_contact_info(link, personeDetails): Extracts contact information from a profile.
         education(link, personeDetails): Extracts educational qualifications from a profile.
-        subreader(tempDetail): Helper method for nested skill extraction within experience entries.
+        snapshot(people, section): Records the loaded section page and returns the parsed page source.
         experience(link, personeDetails): Extracts professional experience entries including roles, duration, and skills.
         get_competancy(about, experience,title): Uses an AI utility to infer a user's core competency based on experience and bio.
-        get_csv(profiles, output_file): Saves all scraped profile data into a CSV file.
+        export(profiles, formats): Saves all scraped profile data in every configured format (CSV, JSON, JSONL, Parquet).
+        get_csv(profiles): Saves all scraped profile data into a CSV file.
         get_json(profiles): Saves all scraped profile data into a JSON file.
         scroll(): Used to implement smooth scrolling of the page to the bottom
+        journal_profile(journal, personeDetails, about): Journals and stores a scraped profile and starts its inference.
+        resume(journal): Restarts the inference of profiles an interrupted run journaled without a competency.
+        finish_profiles(journal, pending, block): Journals the profiles whose competency inference has finished.
+        read_main(people): Loads a profile's main page and reads its top card and fingerprint.
+        read_sections(people, personeDetails): Reads the pages of the requested sections.
+        read_profile(people): Scrapes one profile's top card and the pages of the requested sections.
         profilereader(peoples): Reads multiple LinkedIn profiles and aggregates the data.
+        sign_in(): Reuses the browser profile's session, restores saved cookies, or logs in.
+        search(): Navigates to the company's people page and applies the search query.
+        harvest(): Collects profile links from the people page.
+        refresh(previous, harvest): Rescrapes only the profiles of a previous run whose top card changed.
+        start(): Starts the browser and signs in.
+        run_search(company, search_query, number, sections): Runs one search on the started browser and returns its output files.
+        close(): Finishes inference, closes the stores and quits the browser.
         scraper(): Main function that starts the scraping workflow, including login, navigation, data collection, and file output.
 
     Usage:
@@ -93,17 +172,87 @@ class LinkedInScraper:
     def __init__(self):
         # logging.info("Initializing LinkedInScraper...")
         """
-        Initializes the Firefox WebDriver, sets WebDriverWait, and defines the cookie file path.
+        Sets up the instrumented wait layer, pacing, tracing, storage and inference, and defines the cookie
+        file path. The Firefox WebDriver is only started on first use of `driver`.
         """
-        self.service = Service(executable_path='/usr/local/bin/geckodriver')
-        self.driver = webdriver.Firefox(service= self.service)
-        self.wait = WebDriverWait(self.driver, 10)
-        self.COOKIE_FILE = "cookies.pkl"
+        self.service = None
+        self._driver = None
+        self.tracer = Tracer()
+        self.session = SessionManager()
+        self.waits = SelectorWait(None)
+        self.pacer = Pacer()
+        self.store = ProfileStore()
+        self.cache = CompetencyCache()
+        self.pipeline = CompetencyPipeline(self.get_competancy)
+        self.archive = PageArchive() if config.ARCHIVE_DIR else None
+        self.COOKIE_FILE = config.COOKIE_FILE
         self.email = ''
         self.password = ''
         self.company = ''
         self.search_query = ''
         self.number = ''
+        self.sections = list(config.SECTIONS)
+        self.run_id = ''
+
+    @property
+    def driver(self):
+        """
+        The Firefox WebDriver, launched on first access so offline work (exports, experience
+        counting) never pays for browser startup or the selenium import.
+        """
+        if self._driver is None:
+            from selenium import webdriver
+            from selenium.webdriver.firefox.service import Service
+
+            self.service = Service(executable_path='/usr/local/bin/geckodriver')
+            self._driver = instrument(webdriver.Firefox(service= self.service, options=self.browser_options()))
+            self.waits.driver = self._driver
+        return self._driver
+
+
+    def browser_options(self):
+        """
+        Builds the Firefox options from the browser settings in `config.py`: headless mode,
+        the lean preferences and viewport, and an optional persistent profile directory.
+
+        Returns:
+            Options: Firefox options.
+        """
+        from selenium.webdriver.firefox.options import Options
+
+        options = Options()
+        if config.BROWSER_HEADLESS:
+            options.add_argument("-headless")
+        if config.BROWSER_LEAN:
+            for name, value in config.BROWSER_PREFS.items():
+                options.set_preference(name, value)
+            width, height = config.BROWSER_WINDOW
+            options.add_argument(f"--width={width}")
+            options.add_argument(f"--height={height}")
+        if config.BROWSER_PROFILE:
+            os.makedirs(config.BROWSER_PROFILE, exist_ok=True)
+            options.add_argument("-profile")
+            options.add_argument(config.BROWSER_PROFILE)
+        return options
+
+
+    def maximize(self):
+        """
+        Maximizes the browser window, unless lean mode keeps the configured viewport.
+        """
+        if not config.BROWSER_LEAN:
+            self.driver.maximize_window()
+
+
+    def quit(self):
+        """
+        Closes the browser if it was started.
+        """
+        if self._driver is not None:
+            self._driver.quit()
+            self._driver = None
+            self.waits.driver = None
+
 
     def exp_count(self, entries):
         # logging.info("Calculating total professional experience...")
@@ -116,29 +265,16 @@ class LinkedInScraper:
         Returns:
             str: Total experience in years and months.
         """
-        total_months = 0
-        for entry in entries:
-
-            years = re.search(r'(\d+)\s*yrs?', entry)
-            months = re.search(r'(\d+)\s*mos?', entry)
-
-            year_val = int(years.group(1)) if years else 0
-            month_val = int(months.group(1)) if months else 0
-
-            total_months += year_val * 12 + month_val
-        total_years = total_months // 12
-        remaining_months = total_months % 12
-        return f"{total_years} yrs {remaining_months} mos"
+        return extractor.exp_count(entries)
 
 
 
     def save_cookies(self):
         # logging.info("Saving cookies to file...")
         """
-        Saves the current browser session cookies to a file.
+        Saves the current browser session cookies to the session file.
         """
-        with open(self.COOKIE_FILE, "wb") as file:
-            pickle.dump(self.driver.get_cookies(), file)
+        self.session.save(self.driver)
 
 
 
@@ -146,13 +282,11 @@ class LinkedInScraper:
         # logging.info("Loading cookies from file...")
         """
         Loads saved cookies into the current browser session.
+
+        Returns:
+            bool: True if the restored session is signed in.
         """
-        self.driver.get("https://www.linkedin.com")
-        time.sleep(config.DELAYS["login_page"])
-        with open(self.COOKIE_FILE, "rb") as file:
-            cookies = pickle.load(file)
-            for cookie in cookies:
-                self.driver.add_cookie(cookie)
+        return self.session.restore(self.driver, self.pacer)
 
 
 
@@ -161,27 +295,51 @@ class LinkedInScraper:
         """
         Logs into LinkedIn using credentials
         """
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.common.keys import Keys
+
         login_url = "https://www.linkedin.com/login"
+        self.pacer.throttle()
         self.driver.get(login_url)
-        time.sleep(config.DELAYS["login_page"])
+        self.pacer.settle(self.driver, "login_page", (By.ID, "username"))
        
-        self.driver.maximize_window()
+        self.maximize()
 
-        username = self.wait.until(expected_conditions.presence_of_element_located((By.ID, "username")))
-        password = self.wait.until(expected_conditions.presence_of_element_located((By.ID, "password")))
+        username = self.waits.until("login_username", By.ID, "username", required=True)
+        password = self.waits.until("login_password", By.ID, "password", required=True)
 
         username.clear()
         password.clear()
 
         username.send_keys(self.email)
-        time.sleep(1)
+        self.pacer.dwell("typing")
         password.send_keys(self.password)
-        time.sleep(1)
+        self.pacer.dwell("typing")
 
-        logButton = self.wait.until(expected_conditions.presence_of_element_located((By.XPATH, "/html/body/div/main/div[2]/div[1]/form/div[4]/button")))
+        logButton = self.waits.until("login_button", By.XPATH, "/html/body/div/main/div[2]/div[1]/form/div[4]/button", required=True)
+        self.pacer.throttle()
         logButton.send_keys(Keys.ENTER)
 
 
+    def snapshot(self, people=None, section=None):
+        """
+        Returns a parsed snapshot of the current page, which the caller has already waited for
+        with `pacer.settle()`. The page is also recorded in the page archive, if there is one.
+
+        Args:
+            people (str): Profile URL the page belongs to.
+            section (str): Section the page is archived under.
+
+        Returns:
+            lxml.html.HtmlElement: Parsed page source.
+        """
+        page_source = self.driver.page_source
+        if self.archive is not None and section is not None:
+            self.archive.record(people, section, page_source)
+        return extractor.parse(page_source)
+
+
+    @traced("contact")
     def get_contact_info(self, link, personDetails):
         """
         Extracts contact information from a LinkedIn profile.
@@ -190,46 +348,20 @@ class LinkedInScraper:
             link (str): Direct URL to the contact info section.
             personeDetails (dict): Dictionary to append contact data into.
         """
+        from selenium.webdriver.common.by import By
+
         # logging.info("Extracting contact information...")
+        self.pacer.throttle()
         self.driver.get(link)
-        time.sleep(config.DELAYS["contact_info"])
-        contact_info = {}
-        count = 0
-        while True:
-            count += 1    
-            try:
-                
-                heading = self.wait.until(expected_conditions.presence_of_element_located((By.XPATH, f"//section/div/section[{count}]/h3"))).text
-                if 'profile' in heading.lower().strip().split():
-                    continue
-
-                try:
-                    content = self.wait.until(expected_conditions.presence_of_element_located((By.XPATH, f"//section/div/section[{count}]/div/a"))).text
-                except Exception as e:
-                    try:
-                        content = self.wait.until(expected_conditions.presence_of_element_located((By.XPATH, f"//section/div/section[{count}]/div/span"))).text
-                    except Exception as e:
-                        try:
-                            content = self.wait.until(expected_conditions.presence_of_element_located((By.XPATH, f"//section/div/section[{count}]/ul/li/span[1]"))).text
-                        except Exception as e:
-                            pass
-                
-                contact_info[f'{heading}'] = content
-
-            except Exception as e:
-                break
-        
-        personDetails['Contact_info'] = contact_info
+        self.pacer.settle(self.driver, "contact_info", (By.XPATH, extractor.CONTACT_READY))
 
-        try:
-            self.wait.until(expected_conditions.presence_of_element_located((By.XPATH, f"//button[@aria-label='Dismiss']"))).send_keys(Keys.ENTER)
-        except Exception as e:
-            pass
-        time.sleep(config.DELAYS["profile"])
+        page = self.snapshot(personDetails["Profile Link"], "Contact_info")
+        personDetails['Contact_info'] = extractor.parse_contact_info(page)
 
 
 
 
+    @traced("education")
     def education(self, link, personeDetails):
         # logging.info("Extracting educational history...")
         """
@@ -239,43 +371,19 @@ class LinkedInScraper:
             link (str): Direct URL to the education section of a profile.
             personeDetails (dict): Dictionary to append education data into.
         """
-        tempEducation=[]
-
-        education = self.driver.find_element(By.ID, "education")
-        self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", education)
-        time.sleep(config.DELAYS["scroll"])
+        from selenium.webdriver.common.by import By
 
+        self.pacer.throttle()
         self.driver.get(link)
-        time.sleep(config.DELAYS["education"])
-
-
-        count = 0
-        while True:
-            temp = {}
-            try:
-                count += 1
-                tempDegree = ""
-                tempSchool = self.wait.until(expected_conditions.presence_of_element_located((By.XPATH, f"//li[{count}]/div/div/div[2]/div[1]/a/div/div/div/div/span[1]")))
-                try:
-                    tempDegree = self.wait.until(expected_conditions.presence_of_element_located((By.XPATH, f"//li[{count}]/div/div/div[2]/div[1]/a/span/span")))
-                except Exception as e:
-                    pass
-                temp["Institute"] = tempSchool.text
-                temp["Qualification"] = tempDegree.text
-            except Exception as e:
-                break 
-            tempEducation.append(temp)
-        personeDetails["Education"] = tempEducation
+        self.pacer.settle(self.driver, "education", (By.XPATH, extractor.DETAILS_READY))
 
-        try:
-            self.wait.until(expected_conditions.presence_of_element_located((By.XPATH, f"//button[@aria-label='Back to the main profile page']"))).send_keys(Keys.ENTER)
-        except Exception as e:
-            pass
-        time.sleep(config.DELAYS["profile"])
+        page = self.snapshot(personeDetails["Profile Link"], "Education")
+        personeDetails["Education"] = extractor.parse_education(page)
 
 
 
 
+    @traced("experience")
     def experience(self, link, personeDetails):
         # logging.info("Extracting professional experience...")
         """
@@ -285,83 +393,79 @@ class LinkedInScraper:
             link (str): Direct URL to the experience section.
             personeDetails (dict): Dictionary to append experience data into.
         """
-        experience = self.driver.find_element(By.ID, "experience")
-        self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", experience)
-        time.sleep(config.DELAYS["scroll"])
+        from selenium.webdriver.common.by import By
 
+        self.pacer.throttle()
         self.driver.get(link)
-        time.sleep(config.DELAYS["experience"])
+        self.pacer.settle(self.driver, "experience", (By.XPATH, extractor.DETAILS_READY))
 
-        tempyear = []
-        personExpDetails = []
-        
-        count = 0
-        while True:
-            tempDetail = {}
-            try:
-                count += 1
-                skill = ""
-                role = self.wait.until(expected_conditions.presence_of_element_located((By.XPATH, f"/html/body/div[6]/div[3]/div/div/div[2]/div/div/main/section/div[2]/div/div[1]/ul/li[{count}]/div/div/div[2]/div/a/div/div/div/div/span[1]")))
-                company = self.wait.until(expected_conditions.presence_of_element_located((By.XPATH, f"/html/body/div[6]/div[3]/div/div/div[2]/div/div/main/section/div[2]/div/div[1]/ul/li[{count}]/div/div/div[2]/div/a/span[1]/span[1]")))
-                year = self.wait.until(expected_conditions.presence_of_element_located((By.XPATH, f"/html/body/div[6]/div[3]/div/div/div[2]/div/div/main/section/div[2]/div/div[1]/ul/li[{count}]/div/div/div[2]/div/a/span[2]/span[1]")))
-                tempDetail["role"] = role.text
-                tempDetail["company"] = company.text.split("·")[0]
-                tempDetail["year"] = year.text.split("·")[1]
-                try:
-                    time.sleep(config.DELAYS["skills"])
-                    skill = self.wait.until(expected_conditions.presence_of_element_located((By.XPATH, f"//li[{count}]/div/div/div[2]/div[2]/ul/li[2]/div/ul/li/div/div/div/span")))
-                    tempDetail["skill"] = skill.text.split(":")[1].split("·")
-                except Exception as e:
-                        pass     
-            except Exception as e:
-                try:
-                    company = self.wait.until(expected_conditions.presence_of_element_located((By.XPATH, f"/html/body/div[6]/div[3]/div/div/div[2]/div/div/main/section/div[2]/div/div[1]/ul/li[{count}]/div/div/div[2]/div[1]/a/div/div/div/div/span[1]")))
-                    year = self.wait.until(expected_conditions.presence_of_element_located((By.XPATH, f"/html/body/div[6]/div[3]/div/div/div[2]/div/div/main/section/div[2]/div/div[1]/ul/li[{count}]/div/div/div[2]/div[1]/a/span/span[1]")))
-                    tempDetail["company"] = company.text.split("·")[0]
-                    tempDetail["year"] = year.text.split("·")[1]
-                    self.subreader(tempDetail) 
-
-                except Exception as e:
-                    break
-            tempyear.append(tempDetail["year"])
-            personExpDetails.append(tempDetail)
-     
-        personeDetails["Total_Experiance"] = self.exp_count(tempyear)    
-        personeDetails["Experience"] = personExpDetails  
+        page = self.snapshot(personeDetails["Profile Link"], "Experience")
+        personExpDetails = extractor.parse_experience(page)
 
-        try:
-            self.wait.until(expected_conditions.presence_of_element_located((By.XPATH, f"//button[@aria-label='Back to the main profile page']"))).send_keys(Keys.ENTER)
-        except Exception as e:
-            pass     
-        time.sleep(config.DELAYS["profile"])      
+        personeDetails["Total_Experiance"] = self.exp_count([detail["year"] for detail in personExpDetails])
+        personeDetails["Experience"] = personExpDetails
 
 
+    @traced("competency")
     def get_competancy(self, about, experience,title):
         # logging.info("Generating competency summary using AI...")
         """
-        Generates a competency summary using external AI utility.
+        Generates a competency summary. The local classifier answers when it is confident
+        enough; otherwise the external AI utility is asked. AI results are memoized,
+        so identical inputs never reach the AI service twice.
 
         Args:
             about (str): About section text.
             experience (list): List of experience dicts.
+            title (str): Profile headline.
 
         Returns:
             str: Competency.
         """
-        return AIdata(experience, about, title).strip()
+        from classifier import classify
+
+        competancy, confidence = classify(about, experience, title)
+        if confidence >= config.CLASSIFIER_THRESHOLD:
+            return competancy
+
+        key = cache_key(title, experience, about)
+        competancy = self.cache.get(key)
+        if competancy is None:
+            competancy = AIdata(experience, about, title).strip()
+            self.cache.put(key, competancy)
+        return competancy
+
+
+    @traced("export")
+    def export(self, profiles, formats=config.EXPORT_FORMATS):
+        # logging.info("Exporting data...")
+        """
+        Exports profiles to every configured format in a single pass; all files share the run ID.
+
+        Args:
+            profiles (iterable): Profile dictionaries, e.g. the run's journal.
+            formats (iterable): Export formats, see `export.EXPORTERS`.
+
+        Returns:
+            list: Paths of the written files.
+        """
+        if not self.run_id:
+            self.run_id = run_id(self.company, self.search_query)
+        paths = export_profiles(profiles, self.run_id, formats)
+        for path in paths:
+            print(f"Output file is saved with name " + path)
+        return paths
 
 
     def get_json(self, profiles):
         # logging.info("Exporting data to JSON...")
         """
-        Reads and parses individual LinkedIn profiles.
+        Saves the scraped profiles data as a JSON file.
 
         Args:
-            peoples (list): List of profile URLs.
+            profiles (iterable): Profile dictionaries.
         """
-        with open(f"{self.company}_{self.search_query}_{datetime.datetime.now()}.json", 'w') as file:
-            json.dump(profiles, file, indent=4)
-        print(f"Json file is saved with name " + file.name)
+        self.export(profiles, ["json"])
 
 
     def get_csv(self, profiles):
@@ -370,233 +474,507 @@ class LinkedInScraper:
         Exports scraped data into a CSV file.
 
         Args:
-            profiles (list): List of profile dictionaries.
-            output_file (str): Output CSV filename.
+            profiles (iterable): Profile dictionaries.
         """
+        self.export(profiles, ["csv"])
 
-        flat_data = []
-
-        for profile in profiles:
-            base = {
-                'Name': profile.get('Name'),
-                'Profile Link': profile.get('Profile Link'),
-                'Location': profile.get('Location'),
-                'Total Experience': profile.get('Total_Experiance'),
-                'Competency': profile.get('Competancy'),
-                "Title":profile.get('Title')
-            }
-            
+    def scroll(self):
+        """
+        Smoothly scrolls to the bottom of the page. The whole eased animation runs inside the
+        page with a single async script call, which resolves once the scroll has ended and the
+        page height has stopped growing for `config.SCROLL_IDLE` seconds.
 
-            base['Education'] = '; '.join(
-                f"{edu.get('Institute')}: {edu.get('Qualification')}" 
-                for edu in profile.get('Education', [])
-            )
+        Returns:
+            bool: True if the page grew, i.e. new content was loaded.
+        """
+        self.driver.set_script_timeout(config.SCROLL_DURATION + config.SCROLL_MAX_WAIT + 5)
+        result = self.driver.execute_async_script(SMOOTH_SCROLL, config.SCROLL_DURATION * 1000,
+                                                  config.SCROLL_IDLE * 1000, config.SCROLL_MAX_WAIT * 1000)
+        return bool(result and result.get("grew"))
 
-            base['Experience'] = '; '.join(
-                f"{exp.get('role')} at {exp.get('company')} ({exp.get('year')})" 
-                for exp in profile.get('Experience', [])
-            )
 
-            base['Contact_info'] = '; '.join(
-                f"{key}: {value}" 
-                for key, value in profile.get('Contact_info', {}).items()
-            )
 
-            flat_data.append(base)
+    def journal_profile(self, journal, personeDetails, about):
+        """
+        Journals a freshly scraped profile straight away, saves its sections in the profile store
+        and starts its competency inference. The About text is journaled with it until the
+        competency is known, so an interrupted run can still infer it.
 
-        df = pd.DataFrame(flat_data)
-        filename = f"{self.company}_{self.search_query}_{datetime.datetime.now()}.csv"
-        df.to_csv(filename, index=False)
-        print(f"CSV file is saved with name " + filename)
+        Args:
+            journal (ProfileJournal): Journal of the current run.
+            personeDetails (dict): Scraped profile.
+            about (str): About text of the profile.
 
-    def scroll(self):
-        """
-        Method to implement smooth scrolling of the page
+        Returns:
+            tuple: `(future, personeDetails)` pair to pass to `finish_profiles()`.
         """
-        scroll_duration = 2
-        steps = 100
+        journal.append(dict(personeDetails, About=about))
+        self.store.put(personeDetails["Profile Link"], personeDetails, self.company, self.search_query,
+                       ["Profile", *self.sections])
+        future = self.pipeline.submit(about, personeDetails.get("Experience", []), personeDetails["Title"])
+        return future, personeDetails
 
-        # Get current and maximum scroll position
-        start = self.driver.execute_script("return window.pageYOffset;")
-        end = self.driver.execute_script("return document.body.scrollHeight;")
-        scroll_distance = end - start
-        step_size = scroll_distance / steps
-        delay = scroll_duration / steps
 
-        # Scroll in steps to simulate animation
-        for i in range(steps):
-            y = start + step_size * i
-            self.driver.execute_script(f"window.scrollTo(0, {y});")
-            time.sleep(delay)
+    def resume(self, journal):
+        """
+        Reads the journal of an interrupted run and restarts the inference of the profiles
+        journaled before their competency was known.
 
+        Args:
+            journal (ProfileJournal): Journal of the current run.
+
+        Returns:
+            tuple: The profile links already journaled and the restarted `(future, personeDetails)` pairs.
+        """
+        done, pending = set(), []
+        for profile in journal:
+            done.add(profile.get("Profile Link"))
+            if "Competancy" not in profile:
+                about = profile.pop("About", "")
+                future = self.pipeline.submit(about, profile.get("Experience", []), profile.get("Title", ""))
+                pending.append((future, profile))
+        return done, pending
 
 
-    def subreader(self, tempDetail):
-        # logging.info("Extracting sub-skills from experience...")
+    def finish_profiles(self, journal, pending, block=False):
         """
-        Helper function to extract sub-skills from nested structures under experience.
+        Completes profiles whose competency inference has finished: fills in `Competancy` and
+        journals the completed profile again. The competency is only marked fresh in the profile
+        store when inference succeeded, so a failed one is retried by a later run.
 
         Args:
-            tempDetail (dict): Experience entry to append skills into.
+            journal (ProfileJournal): Journal of the current run.
+            pending (list): `(future, personeDetails)` pairs still waiting for inference.
+            block (bool): Wait for every pending inference instead of only the finished ones.
+
+        Returns:
+            list: The pairs that are still pending.
         """
-        temp = []
-        for count in range(1, 5):
+        if block and pending:
+            # Nothing else will join the batch; do not linger for it
+            flush_batch()
+        remaining = []
+        for future, personeDetails in pending:
+            if not block and not future.done():
+                remaining.append((future, personeDetails))
+                continue
             try:
-                skill = self.wait.until(expected_conditions.presence_of_element_located((By.XPATH, f"/html/body/div[6]/div[3]/div/div/div[2]/div/div/main/section/div[2]/div/div[1]/ul/li[2]/div/div/div[2]/div[2]/ul/li/div/div/div[1]/ul/li[{count}]/div/div/div[2]/div[2]/ul/li[2]/div/ul/li/div/div/div/span[1]")))
-                temp.append(skill.text.split(":")[1].split("·"))
+                personeDetails["Competancy"] = future.result()
+                sections = ["Competancy"]
             except Exception as e:
-                pass
-        tempDetail["skill"] = temp
+                print(f"Competency inference failed for {personeDetails.get('Name', '')}: {e}")
+                personeDetails["Competancy"] = ""
+                sections = []
+            journal.append(personeDetails)
+            self.store.put(personeDetails["Profile Link"], {"Competancy": personeDetails["Competancy"]},
+                           self.company, self.search_query, sections)
+        return remaining
 
 
+    def read_main(self, people):
+        """
+        Loads a profile's main page and reads its top card, including the fingerprint used by refresh runs.
 
+        Args:
+            people (str): Normalized profile URL.
 
-    def profilereader(self, peoples):
-        # logging.info("Reading and scraping individual LinkedIn profiles...")
-        """
-        Saves the scraped profiles data as a JSON file.
+        Returns:
+            tuple: The profile dictionary and the About text used for competency inference.
         """
-        profiles = []
-        for people in peoples:
-            personeDetails = {}
+        from selenium.webdriver.common.by import By
+
+        personeDetails = {}
+        with self.tracer.span("main"):
+            self.pacer.throttle()
             self.driver.get(people)
-            time.sleep(config.DELAYS["profile"])
+            self.pacer.settle(self.driver, "profile", (By.XPATH, "//span/a/h1"))
 
             personeDetails["Profile Link"] = people
             about = ""
             personeDetails["Title"] = ""
 
             try:
-                about = self.wait.until(expected_conditions.presence_of_element_located((By.XPATH, "//section[2]/div[3]/div/div/div/span"))).text
+                about = self.waits.until("profile_about", By.XPATH, "//section[2]/div[3]/div/div/div/span").text
             except Exception as e:
                 pass    
 
-            personeDetails["Name"] = self.wait.until(expected_conditions.presence_of_element_located((By.XPATH, "//span/a/h1"))).text
+            personeDetails["Name"] = self.waits.until("profile_name", By.XPATH, "//span/a/h1", required=True).text
             print("Scrapping started for this profile :" + personeDetails["Name"])
 
             try:
-                personeDetails["Title"] = self.wait.until(expected_conditions.presence_of_element_located((By.XPATH, "//section/div[2]/div[2]/div/div[2]"))).text
+                personeDetails["Title"] = self.waits.until("profile_title", By.XPATH, "//section/div[2]/div[2]/div/div[2]").text
             except Exception as e:
                 pass    
 
             personeDetails["Location"] = ""
             try:
-                personeDetails["Location"] = self.wait.until(expected_conditions.presence_of_element_located((By.XPATH, "//div[2]/span"))).text
+                personeDetails["Location"] = self.waits.until("profile_location", By.XPATH, "//div[2]/span").text
 
             except Exception as e:
                 pass    
 
-            self.get_contact_info(people + "/overlay/contact-info", personeDetails)
-            self.education(people + "/details/education", personeDetails)
-            self.experience(people + "/details/experience", personeDetails)
-            personeDetails["Competancy"] = self.get_competancy(about, personeDetails["Experience"], personeDetails["Title"])
-            profiles.append(personeDetails)
+            personeDetails["Fingerprint"] = fingerprint(personeDetails["Name"], personeDetails["Title"],
+                                                        personeDetails["Location"], about)
+            if self.archive is not None:
+                self.archive.record(people, "Profile", self.driver.page_source)
+        return personeDetails, about
+
+
+    def read_sections(self, people, personeDetails):
+        """
+        Visits the page of every requested section (`sections`) in the order of the navigation plan.
+
+        Args:
+            people (str): Normalized profile URL.
+            personeDetails (dict): Profile dictionary to fill.
+        """
+        readers = {"Contact_info": self.get_contact_info, "Education": self.education, "Experience": self.experience}
+        for section, link in plan(people, self.sections):
+            readers[section](link, personeDetails)
+
+
+    def read_profile(self, people):
+        """
+        Scrapes one profile: the top card, then the page of every requested section.
+
+        Args:
+            people (str): Normalized profile URL.
+
+        Returns:
+            tuple: The profile dictionary and the About text used for competency inference.
+        """
+        personeDetails, about = self.read_main(people)
+        self.read_sections(people, personeDetails)
+        return personeDetails, about
+
+
+    def profilereader(self, peoples):
+        # logging.info("Reading and scraping individual LinkedIn profiles...")
+        """
+        Reads and parses individual LinkedIn profiles. Each finished profile is appended to the
+        run's journal straight away; profiles already in the journal of an interrupted run are
+        skipped, and the exports are built from the journal once all profiles are done, after
+        which the journal is marked complete. Profiles still fresh
+        in the profile store are taken from there without opening their page. The competency
+        of each profile is inferred in the background while the next profile is scraped.
+        Every profile is visited at most once; one that fails is marked failed and skipped.
+
+        Args:
+            peoples (Frontier | list): Frontier or list of profile URLs.
+
+        Returns:
+            list: Paths of the written output files.
+        """
+        if not self.run_id:
+            self.run_id = run_id(self.company, self.search_query)
+        frontier = peoples if isinstance(peoples, Frontier) else Frontier(peoples)
+        journal = ProfileJournal(journal_path(self.company, self.search_query))
+        done, pending = self.resume(journal)
+        for people in frontier:
+            if people in done:
+                frontier.mark(people, DONE)
+                print("Skipping already scraped profile :" + people)
+                continue
+
+            stored = self.store.get(people, ["Profile", *self.sections, "Competancy"])
+            if stored is not None:
+                journal.append(stored)
+                frontier.mark(people, DONE)
+                print("Profile taken from the profile store :" + stored.get("Name", people))
+                continue
+
+            try:
+                with self.tracer.span("profile", url=people):
+                    personeDetails, about = self.read_profile(people)
+            except Exception as e:
+                frontier.mark(people, FAILED)
+                print(f"Scrapping failed for this profile :{people} ({e})")
+                continue
+
+            pending.append(self.journal_profile(journal, personeDetails, about))
+            frontier.mark(people, DONE)
+            self.waits.save()
+            self.tracer.write(self.run_id)
             print("Scrapping completed for this profile :" + personeDetails["Name"])
+            pending = self.finish_profiles(journal, pending)
 
-        self.get_json(profiles)
-        self.get_csv(profiles)
+        self.finish_profiles(journal, pending, block=True)
+        print("Profiles done: {done}, failed: {failed}".format(**frontier.counts()))
+        paths = self.export(profile for profile in journal if profile.get("Profile Link") in frontier)
+        journal.complete()
+        return paths
 
 
-    def scraper(self):
-        # logging.info("Starting the scraping process...")
+    def sign_in(self):
         """
-        Main function to handle navigation and scraping workflow on LinkedIn.
+        Signs in with as little work as possible: the session of the persistent browser profile is
+        reused if it is still signed in, otherwise the saved cookies are replayed, and only when both
+        fail does it log in with credentials.
         """
-        print("Scrapping is starting, Please Wait")
-       
-        if os.path.exists(self.COOKIE_FILE):
-            print("[*] Loading cookies...")
-            self.driver.maximize_window()
-            self.load_cookies()
-            self.driver.refresh()
-            
-
-        else:
-            print("[*] No cookie file found. Logging in manually...")
-            self.login()    
-            time.sleep(config.DELAYS["security_check"])
+        from selenium.webdriver.common.by import By
+
+        self.session.legacy_file = self.COOKIE_FILE
+        with self.tracer.span("login") as span:
+            self.maximize()
+            if self.session.valid(self.driver, self.pacer):
+                span["attrs"]["method"] = "profile"
+                print("[*] Session restored from the browser profile")
+                return
+
+            if self.load_cookies():
+                span["attrs"]["method"] = "cookies"
+                print("[*] Session restored from saved cookies")
+                return
+
+            span["attrs"]["method"] = "password"
+            print("[*] No valid session found. Logging in manually...")
+            self.login()
+            self.pacer.settle(self.driver, "security_check", (By.XPATH, SEARCH_BAR))
             self.save_cookies()
-        
 
 
-        
+    @traced("search")
+    def search(self):
+        """
+        Navigates to the company's people page and filters it by the search query. Starts from the
+        feed, so it also works after an earlier search has left the browser on a profile page.
+        """
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.common.keys import Keys
+
+        if not urlparse(self.driver.current_url).path.startswith("/feed"):
+            self.pacer.throttle()
+            self.driver.get(FEED_URL)
+            self.pacer.settle(self.driver, "search", (By.XPATH, SEARCH_BAR))
+
         # Search for the company
-        time.sleep(config.DELAYS["search"])
-        searchBar = self.wait.until(expected_conditions.presence_of_element_located((By.XPATH, '/html/body/div[6]/header/div/div/div/div[1]/input')))
+        searchBar = self.waits.until("search_bar", By.XPATH, SEARCH_BAR, required=True)
         searchBar.clear()
+        self.pacer.throttle()
         searchBar.send_keys(self.company + Keys.ENTER)
 
         # Filter for companies, select first result, go to "People"
-        selectCompany = self.wait.until(expected_conditions.presence_of_element_located((By.XPATH, "//button[text()='Companies']")))
+        selectCompany = self.waits.until("companies_filter", By.XPATH, "//button[text()='Companies']", required=True)
+        self.pacer.throttle()
         selectCompany.send_keys(Keys.ENTER)
 
-        time.sleep(config.DELAYS['search_results'])
-        chooseCompany = self.wait.until(expected_conditions.presence_of_element_located((By.XPATH, "//div/span/span/a")))
+        self.pacer.settle(self.driver, "search_results", (By.XPATH, "//div/span/span/a"))
+        chooseCompany = self.waits.until("company_result", By.XPATH, "//div/span/span/a", required=True)
+        self.pacer.throttle()
         chooseCompany.send_keys(Keys.ENTER)
 
-        time.sleep(config.DELAYS['people_page'])
-        companyPeople = self.wait.until(expected_conditions.presence_of_element_located((By.XPATH, "//a[text()='People']")))
+        self.pacer.settle(self.driver, "people_page", (By.XPATH, "//a[text()='People']"))
+        companyPeople = self.waits.until("people_tab", By.XPATH, "//a[text()='People']", required=True)
+        self.pacer.throttle()
         companyPeople.send_keys(Keys.ENTER)
 
         # Filter employees by skill (e.g., Java)
-        time.sleep(config.DELAYS['search_query'])
-        selectPeople = self.wait.until(expected_conditions.presence_of_element_located((By.XPATH, "//div/textarea")))
+        self.pacer.settle(self.driver, "search_query", (By.XPATH, "//div/textarea"))
+        selectPeople = self.waits.until("people_search", By.XPATH, "//div/textarea", required=True)
         selectPeople.clear()
+        self.pacer.throttle()
         selectPeople.send_keys(self.search_query + Keys.ENTER)
 
-        # Scrape people links
-        peopleList = []
-        count = -1
-        notMemberCount = 0
-        counter = 0
 
+    @traced("harvest")
+    def harvest(self):
+        """
+        Collects profile links from the people page: every loaded card's link in one call,
+        then scrolls and loads more until enough links are collected. Stops when
+        `HARVEST_STALE_ROUNDS` clicks on "load more" in a row bring no new links, e.g. when
+        the button stays visible but disabled or the page is rate limited.
+
+        Returns:
+            Frontier: The collected profile URLs.
+        """
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.common.keys import Keys
 
+        self.pacer.settle(self.driver, "people_page", (By.CSS_SELECTOR, PEOPLE_CARDS))
+        frontier = Frontier(limit=self.number)
+        clicked, stale = None, 0
         while True:
-            count += 1
-            try:
+            for link in self.driver.execute_script(HARVEST_LINKS, PEOPLE_CARDS):
+                frontier.add(link)
+            print(f"{len(frontier)} profile links collected")
+            if frontier.full():
+                break
+            if clicked is not None:
+                stale = stale + 1 if len(frontier) == clicked else 0
+                if stale >= HARVEST_STALE_ROUNDS:
+                    print("Loading more brought no new profile links, stopping")
+                    break
+
+            # Out of loaded cards: scrolling may lazy-load more before "load more" is needed
+            if self.scroll():
+                continue
 
-                self.scroll()
-                time.sleep(config.DELAYS['scroll'])
+            try:
+                loadmore = self.waits.until("load_more", By.XPATH, LOAD_MORE)
+            except Exception as e:
+                break
+            clicked = len(frontier)
+            self.pacer.throttle()
+            loadmore.send_keys(Keys.ENTER)
+            self.pacer.settle(self.driver, "load_more")
+        return frontier
 
-                profileData = self.wait.until(expected_conditions.presence_of_element_located((By.XPATH, f'//*[@id="org-people-profile-card__profile-image-{count}"]')))
-                temp = profileData.get_attribute('href')
-                if temp is not None:
-                    counter += 1
-                    peopleList.append(temp.split("?")[0])
-                    print(counter)
-                    if len(peopleList) == self.number:
-                        self.profilereader(peopleList)
-                        break
 
-            #     else:
-            #         notMemberCount += 1
-            #         if (notMemberCount / count) > 0.5 and count == 10:
-            #             raise NotEnoughNetworkException("You doesnt have the network reach to that company please expand your network then try again")
-                        
+    def refresh(self, previous, harvest=False):
+        """
+        Refreshes a previous run. Each profile's main page is loaded once; when its top card
+        fingerprint matches the previous record, the detail pages are skipped and the old data
+        is carried forward, otherwise the profile is scraped again. Writes the refreshed profiles
+        to the usual outputs and a per-profile diff to `<run_id>.diff.json`.
 
-            # except NotEnoughNetworkException as e:
-            #     print(e)
-            #     break
+        Args:
+            previous (str): JSON or JSON Lines export, or journal, of the previous run. Parquet exports
+                flatten the experience skills, so they are not accepted.
+            harvest (bool): Also search again (`company`, `search_query`, `number`) and add new profiles.
 
+        Returns:
+            tuple: Paths of the written output files and the path of the diff.
 
+        Raises:
+            ValueError: If `previous` is a Parquet file.
+        """
+        if previous.endswith(".parquet"):
+            raise ValueError("Parquet exports cannot be refreshed, their experience entries are flattened; "
+                             "use the run's .json or .jsonl.gz export")
+        old = {}
+        for profile in read_profiles(previous):
+            if profile.get("Profile Link"):
+                old[normalize_url(profile["Profile Link"])] = profile
+        if not self.run_id:
+            self.run_id = run_id(self.company or "refresh", self.search_query)
+
+        frontier = Frontier(old)
+        if harvest:
+            self.search()
+            for people in self.harvest().states:
+                frontier.add(people)
+
+        name = os.path.basename(previous).split(".")[0]
+        journal = ProfileJournal(journal_path("refresh", name))
+        changes = ProfileJournal(journal_path("refresh", name + "_diff"))
+        done, pending = self.resume(journal)
+        for people in frontier:
+            if people in done:
+                frontier.mark(people, DONE)
+                continue
+
+            previous_profile = old.get(people)
+            try:
+                with self.tracer.span("profile", url=people, refresh=True):
+                    personeDetails, about = self.read_main(people)
+                    unchanged = previous_profile is not None and \
+                        previous_profile.get("Fingerprint") == personeDetails["Fingerprint"]
+                    if not unchanged:
+                        self.read_sections(people, personeDetails)
             except Exception as e:
+                frontier.mark(people, FAILED)
+                # The previous record carries forward unchanged; only a new profile that failed is left out
+                if previous_profile is not None:
+                    journal.append(previous_profile)
+                changes.append(failure(people, (previous_profile or {}).get("Name", "")))
+                print(f"Refresh failed for this profile :{people} ({e})")
+                continue
+
+            if unchanged:
+                carried = dict(previous_profile, **personeDetails)
+                journal.append(carried)
+                self.store.put(people, carried, self.company, self.search_query, ["Profile"])
+                changes.append(diff(previous_profile, carried))
+                print("Profile unchanged :" + personeDetails["Name"])
+            else:
+                changes.append(diff(previous_profile, personeDetails))
+                pending.append(self.journal_profile(journal, personeDetails, about))
+                print("Profile rescraped :" + personeDetails["Name"])
+            frontier.mark(people, DONE)
+            self.waits.save()
+            self.tracer.write(self.run_id)
+            pending = self.finish_profiles(journal, pending)
+
+        self.finish_profiles(journal, pending, block=True)
+        # A profile retried after an interruption keeps only its latest entry
+        entries = list(changes)
+        counts = summarize(entries)
+        print("Refresh: {added} added, {changed} changed, {unchanged} unchanged, {failed} failed".format(**counts))
+        diff_path = self.run_id + ".diff.json"
+        with open(diff_path, "w") as file:
+            json.dump({"previous": previous, "counts": counts, "profiles": entries}, file, indent=4)
+        print("Diff is saved with name " + diff_path)
+        paths = self.export(journal)
+        # The next refresh of the same baseline starts over; only an interrupted refresh resumes
+        journal.complete()
+        changes.complete()
+        return paths, diff_path
+
+
+    def start(self):
+        """
+        Starts the browser and signs in. The session then serves any number of `run_search()` calls.
+        """
+        print("Scrapping is starting, Please Wait")
+        self.sign_in()
+
+
+    def run_search(self, company, search_query, number, sections=None):
+        """
+        Runs one search on the started browser: searches the company's people, harvests the profile
+        links and reads the profiles. Each search is a run of its own, with its own run ID, journal,
+        trace and output files.
+
+        Args:
+            company (str): Target company name.
+            search_query (str): Skill or keyword to filter employee search results.
+            number (int): Number of employee profiles to scrape.
+            sections (list): Detail sections to read; defaults to `config.SECTIONS`.
+
+        Returns:
+            list: Paths of the written output files.
+        """
+        self.company = company
+        self.search_query = search_query
+        self.number = number
+        self.sections = list(sections or config.SECTIONS)
+        self.run_id = run_id(company, search_query)
+
+        self.search()
+        frontier = self.harvest()
 
-                try:
-                    time.sleep(config.DELAYS["load_more"])
-                    loadmore = self.wait.until(expected_conditions.presence_of_element_located((By.XPATH, "/html/body/div[6]/div[3]/div/div[2]/div/div[2]/main/div[2]/div/div/div[2]/div/div[2]/div/button")))
-                    loadmore.send_keys(Keys.ENTER)
-                    self.scroll()
-                    time.sleep(config.DELAYS["scroll"])
-                    
-                except Exception as e:
-                    if len(peopleList) > 0:
-                        self.profilereader(peopleList)
-                    else:
-                        break    
-                        
+        paths = []
+        if len(frontier) > 0:
+            paths = self.profilereader(frontier)
+        self.waits.save()
+        self.tracer.write(self.run_id)
+        self.tracer = Tracer()
+        return paths
 
+
+    def close(self):
+        """
+        Waits for pending inference, closes the caches and stores and quits the browser.
+        """
+        self.waits.save()
+        self.pipeline.close()
+        print("Competency cache: {memory_hits} memory hits, {disk_hits} disk hits, {misses} misses".format(**self.cache.stats()))
+        self.cache.close()
+        self.store.close()
+        if self.archive is not None:
+            self.archive.close()
+        self.quit()
+
+
+    def scraper(self):
+        # logging.info("Starting the scraping process...")
+        """
+        Main function to handle navigation and scraping workflow on LinkedIn.
+        """
+        self.start()
+        self.run_search(self.company, self.search_query, self.number, self.sections)
         print("Scrapping is completed. Please review your file")
-        self.driver.quit()
+        self.close()
 
 if __name__ == "__main__":
     obj = LinkedInScraper()
@@ -0,0 +1,254 @@
+"""
+Batch service mode for the LinkedIn Scraper.
+
+Searches are queued as jobs (company, search_query, number, sections) in a
+local SQLite queue and processed one after another by a single long-lived
+`LinkedInScraper`. The browser is started and signed in once; every job runs
+under the same pacing limits and gets its own run ID, journal, trace and
+output files. Repeating a job, e.g. from a nightly list of searches, starts a
+fresh journal: profiles scraped within `STORE_TTL_DAYS` are taken from the
+profile store and all others are scraped again. Job specs can also be dropped as JSON files (one object or a list
+of objects) into the spool directory.
+
+Usage:
+    python service.py add --company Google --query Java --number 20 [--sections Experience ...]
+    python service.py run [--spool spool] [--watch]
+    python service.py status
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import time
+import config
+from navigation import plan
+
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    company TEXT NOT NULL,
+    search_query TEXT NOT NULL,
+    number INTEGER NOT NULL,
+    sections TEXT,
+    status TEXT NOT NULL,
+    outputs TEXT,
+    error TEXT,
+    created_at REAL,
+    started_at REAL,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, id);
+"""
+
+
+class JobQueue:
+    """
+    SQLite-backed FIFO queue of search jobs with per-job status and outputs.
+
+    Attributes:
+        path (str): Path of the SQLite database.
+        connection (sqlite3.Connection): Open database connection.
+    """
+
+    def __init__(self, path=config.SERVICE_QUEUE):
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.executescript(_SCHEMA)
+
+    def add(self, company, search_query, number, sections=None):
+        """
+        Queues a job.
+
+        Args:
+            company (str): Target company name.
+            search_query (str): Skill or keyword to filter employee search results.
+            number (int): Number of profiles to scrape.
+            sections (list): Detail sections to read; None for `config.SECTIONS`.
+
+        Returns:
+            int: The job ID.
+
+        Raises:
+            ValueError: If a section is unknown.
+        """
+        if sections:
+            plan("", sections)
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO jobs (company, search_query, number, sections, status, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (company, search_query, int(number), json.dumps(sections) if sections else None, QUEUED, time.time()))
+        return cursor.lastrowid
+
+    def ingest(self, spool):
+        """
+        Queues the job specs found in the spool directory. Accepted files are moved to
+        `<spool>/accepted`, files that cannot be read to `<spool>/rejected`.
+
+        Args:
+            spool (str): Spool directory.
+
+        Returns:
+            int: Number of jobs queued.
+        """
+        if not spool or not os.path.isdir(spool):
+            return 0
+        count = 0
+        for name in sorted(os.listdir(spool)):
+            path = os.path.join(spool, name)
+            if not name.endswith(".json") or not os.path.isfile(path):
+                continue
+            try:
+                with open(path) as file:
+                    specs = json.load(file)
+                jobs = [(spec["company"], spec["search_query"], int(spec["number"]), spec.get("sections"))
+                        for spec in (specs if isinstance(specs, list) else [specs])]
+                for job in jobs:
+                    plan("", job[3] or [])
+                for job in jobs:
+                    self.add(*job)
+                count += len(jobs)
+                target = "accepted"
+            except (ValueError, KeyError, TypeError) as e:
+                print(f"Rejected job spec {name}: {e}")
+                target = "rejected"
+            os.makedirs(os.path.join(spool, target), exist_ok=True)
+            os.replace(path, os.path.join(spool, target, name))
+        return count
+
+    def recover(self):
+        """
+        Puts jobs left running by a crashed process back in the queue; their journals let them resume.
+        """
+        with self.connection:
+            self.connection.execute("UPDATE jobs SET status = ? WHERE status = ?", (QUEUED, RUNNING))
+
+    def next(self):
+        """
+        Claims the oldest queued job.
+
+        Returns:
+            sqlite3.Row: The job, or None when the queue is empty.
+        """
+        job = self.connection.execute("SELECT * FROM jobs WHERE status = ? ORDER BY id LIMIT 1", (QUEUED,)).fetchone()
+        if job is not None:
+            with self.connection:
+                self.connection.execute("UPDATE jobs SET status = ?, started_at = ? WHERE id = ?",
+                                        (RUNNING, time.time(), job["id"]))
+        return job
+
+    def finish(self, job_id, outputs=None, error=None):
+        """
+        Records the outcome of a job.
+
+        Args:
+            job_id (int): Job ID.
+            outputs (list): Paths of the written output files.
+            error (str): Error message if the job failed.
+        """
+        with self.connection:
+            self.connection.execute(
+                "UPDATE jobs SET status = ?, outputs = ?, error = ?, finished_at = ? WHERE id = ?",
+                (FAILED if error else DONE, json.dumps(outputs or []), error, time.time(), job_id))
+
+    def jobs(self):
+        """
+        Returns every job, oldest first.
+        """
+        return self.connection.execute("SELECT * FROM jobs ORDER BY id").fetchall()
+
+    def close(self):
+        """
+        Closes the database connection.
+        """
+        self.connection.close()
+
+
+def run(queue, spool=config.SERVICE_SPOOL, watch=False):
+    """
+    Processes queued jobs on one warm `LinkedInScraper` until the queue is empty, or forever with `watch`.
+
+    Args:
+        queue (JobQueue): Job queue.
+        spool (str): Spool directory checked for new job specs before every job.
+        watch (bool): Keep polling for new jobs every `config.SERVICE_POLL` seconds.
+    """
+    from scraper import LinkedInScraper
+
+    scraper = LinkedInScraper()
+    scraper.email = os.environ.get("LINKEDIN_EMAIL", "")
+    scraper.password = os.environ.get("LINKEDIN_PASSWORD", "")
+    queue.recover()
+    started = False
+    try:
+        while True:
+            queue.ingest(spool)
+            job = queue.next()
+            if job is None:
+                if not watch:
+                    break
+                time.sleep(config.SERVICE_POLL)
+                continue
+
+            print(f"Job {job['id']}: {job['company']} / {job['search_query']} ({job['number']} profiles)")
+            try:
+                if not started:
+                    scraper.start()
+                    started = True
+                sections = json.loads(job["sections"]) if job["sections"] else None
+                outputs = scraper.run_search(job["company"], job["search_query"], job["number"], sections)
+            except Exception as e:
+                queue.finish(job["id"], error=f"{type(e).__name__}: {e}")
+                print(f"Job {job['id']} failed: {e}")
+                # Start over with a fresh browser and session for the next job
+                scraper.quit()
+                started = False
+                continue
+            queue.finish(job["id"], outputs)
+            print(f"Job {job['id']} done: " + ", ".join(outputs))
+    finally:
+        scraper.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--queue", default=config.SERVICE_QUEUE, help="SQLite job queue")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    add = commands.add_parser("add", help="Queue a job")
+    add.add_argument("--company", required=True)
+    add.add_argument("--query", required=True)
+    add.add_argument("--number", type=int, required=True)
+    add.add_argument("--sections", nargs="+", help="Detail sections to read (default: config.SECTIONS)")
+
+    run_parser = commands.add_parser("run", help="Process the queued jobs")
+    run_parser.add_argument("--spool", default=config.SERVICE_SPOOL, help="Directory of JSON job specs")
+    run_parser.add_argument("--watch", action="store_true", help="Keep waiting for new jobs")
+
+    commands.add_parser("status", help="Show every job and its outputs")
+    args = parser.parse_args()
+
+    queue = JobQueue(args.queue)
+    try:
+        if args.command == "add":
+            print(f"Job {queue.add(args.company, args.query, args.number, args.sections)} queued")
+        elif args.command == "run":
+            run(queue, args.spool, args.watch)
+        else:
+            for job in queue.jobs():
+                outputs = ", ".join(json.loads(job["outputs"] or "[]"))
+                print(f"{job['id']:>4} {job['status']:<8} {job['company']} / {job['search_query']} "
+                      f"({job['number']}) {job['error'] or outputs}")
+    finally:
+        queue.close()
+
+
+if __name__ == "__main__":
+    main()
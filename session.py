@@ -0,0 +1,110 @@
+"""
+Warm session reuse for the LinkedIn Scraper.
+
+The browser runs on a persistent Firefox profile directory
+(`config.BROWSER_PROFILE`), so cookies, local storage and the HTTP cache survive
+between runs. A run first checks with a single page load whether that session is
+still signed in. Only if it is not are the saved cookies replayed, and only if
+those are stale too does the scraper log in with credentials.
+
+Cookies are saved as JSON and written atomically; a legacy pickle cookie file
+is still read when no JSON state exists.
+"""
+
+import json
+import os
+import pickle
+import time
+from urllib.parse import urlparse
+import config
+
+
+FEED_URL = "https://www.linkedin.com/feed/"
+HOME_URL = "https://www.linkedin.com"
+
+
+class SessionManager:
+    """
+    Checks, restores and saves the signed-in LinkedIn session.
+
+    Attributes:
+        state_file (str): JSON file the session cookies are saved to.
+        legacy_file (str): Pickle cookie file of older versions, read when there is no JSON state.
+    """
+
+    def __init__(self, state_file=config.SESSION_FILE, legacy_file=config.COOKIE_FILE):
+        self.state_file = state_file
+        self.legacy_file = legacy_file
+
+    def valid(self, driver, pacer):
+        """
+        Loads the feed once and tells whether the browser is still signed in, i.e. was not
+        redirected to the login page or a security check.
+
+        Args:
+            driver (Firefox): Browser instance.
+            pacer (Pacer): Request scheduler.
+
+        Returns:
+            bool: True if the session is signed in.
+        """
+        pacer.throttle()
+        driver.get(FEED_URL)
+        pacer.settle(driver, "login_page")
+        return urlparse(driver.current_url).path.startswith("/feed")
+
+    def saved(self):
+        """
+        Returns True if session cookies were saved by an earlier run.
+        """
+        return os.path.exists(self.state_file) or bool(self.legacy_file and os.path.exists(self.legacy_file))
+
+    def load(self):
+        """
+        Reads the saved cookies.
+
+        Returns:
+            list: Cookie dicts, empty when nothing was saved.
+        """
+        if os.path.exists(self.state_file):
+            with open(self.state_file) as file:
+                return json.load(file).get("cookies", [])
+        if self.legacy_file and os.path.exists(self.legacy_file):
+            with open(self.legacy_file, "rb") as file:
+                return pickle.load(file)
+        return []
+
+    def restore(self, driver, pacer):
+        """
+        Replays the saved cookies into the browser and checks the session again.
+        Must be called while a linkedin.com page is open, e.g. after `valid()`.
+
+        Args:
+            driver (Firefox): Browser instance.
+            pacer (Pacer): Request scheduler.
+
+        Returns:
+            bool: True if the restored session is signed in.
+        """
+        cookies = self.load()
+        if not cookies:
+            return False
+        if urlparse(driver.current_url).hostname != urlparse(HOME_URL).hostname:
+            pacer.throttle()
+            driver.get(HOME_URL)
+            pacer.settle(driver, "login_page")
+        for cookie in cookies:
+            driver.add_cookie(cookie)
+        return self.valid(driver, pacer)
+
+    def save(self, driver):
+        """
+        Saves the browser's cookies. The file is replaced atomically and readable by the owner only.
+
+        Args:
+            driver (Firefox): Browser instance.
+        """
+        tmp = self.state_file + ".tmp"
+        with open(os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "w") as file:
+            json.dump({"saved_at": time.time(), "cookies": driver.get_cookies()}, file)
+        os.replace(tmp, self.state_file)
@@ -0,0 +1,112 @@
+"""
+Persistent cross-run profile store for the LinkedIn Scraper.
+
+Scraped profiles are kept in a local SQLite database keyed by the normalized
+profile URL, with a timestamp for every section. A profile whose sections are
+all younger than the configured TTL is served from the store instead of being
+scraped again.
+"""
+
+import json
+import sqlite3
+import time
+import config
+
+
+# Sections of a profile that are timestamped separately, with the profile keys they fill.
+SECTIONS = {
+    "Profile": ("Profile Link", "Name", "Title", "Location", "Fingerprint"),
+    "Contact_info": ("Contact_info",),
+    "Education": ("Education",),
+    "Experience": ("Experience", "Total_Experiance"),
+    "Competancy": ("Competancy",),
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS profiles (
+    url TEXT PRIMARY KEY,
+    company TEXT,
+    search_query TEXT,
+    location TEXT,
+    scraped_at REAL,
+    data TEXT
+);
+CREATE TABLE IF NOT EXISTS sections (
+    url TEXT,
+    section TEXT,
+    scraped_at REAL,
+    PRIMARY KEY (url, section)
+);
+CREATE INDEX IF NOT EXISTS idx_profiles_company ON profiles (company);
+CREATE INDEX IF NOT EXISTS idx_profiles_location ON profiles (location);
+CREATE INDEX IF NOT EXISTS idx_profiles_scraped_at ON profiles (scraped_at);
+"""
+
+
+class ProfileStore:
+    """
+    SQLite-backed store of scraped profiles with per-section timestamps.
+
+    Attributes:
+        path (str): Path of the SQLite database.
+        ttl (float): Number of seconds a section stays fresh.
+        connection (sqlite3.Connection): Open database connection.
+    """
+
+    def __init__(self, path=config.STORE_FILE, ttl_days=config.STORE_TTL_DAYS):
+        self.path = path
+        self.ttl = ttl_days * 24 * 60 * 60
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(_SCHEMA)
+
+    def get(self, url, sections=SECTIONS):
+        """
+        Returns a stored profile if every requested section is still fresh.
+
+        Args:
+            url (str): Normalized profile URL.
+            sections (iterable): Section names that must be fresh.
+
+        Returns:
+            dict: The stored profile, or None when it is missing or stale.
+        """
+        row = self.connection.execute("SELECT data FROM profiles WHERE url = ?", (url,)).fetchone()
+        if row is None:
+            return None
+        oldest = time.time() - self.ttl
+        stamps = dict(self.connection.execute("SELECT section, scraped_at FROM sections WHERE url = ?", (url,)))
+        for section in sections:
+            if stamps.get(section, 0) < oldest:
+                return None
+        return json.loads(row[0])
+
+    def put(self, url, profile, company="", search_query="", sections=SECTIONS):
+        """
+        Stores a profile and marks the given sections as scraped now. Sections not given
+        keep their previous data and timestamp.
+
+        Args:
+            url (str): Normalized profile URL.
+            profile (dict): Scraped profile data.
+            company (str): Company the profile was found under.
+            search_query (str): Search keyword the profile was found with.
+            sections (iterable): Section names that were scraped.
+        """
+        now = time.time()
+        row = self.connection.execute("SELECT data FROM profiles WHERE url = ?", (url,)).fetchone()
+        data = json.loads(row[0]) if row else {}
+        data.update(profile)
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO profiles (url, company, search_query, location, scraped_at, data) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (url, company, search_query, data.get("Location", ""), now, json.dumps(data, ensure_ascii=False)))
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO sections (url, section, scraped_at) VALUES (?, ?, ?)",
+                [(url, section, now) for section in sections])
+
+    def close(self):
+        """
+        Closes the database connection.
+        """
+        self.connection.close()
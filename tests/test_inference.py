@@ -0,0 +1,141 @@
+"""
+Competency inference against a local HTTP stub of the AI service.
+
+Run from the repository root with `python -m pytest tests`.
+"""
+
+import json
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+from urllib.error import HTTPError
+
+import config
+import utils
+from inference import BATCH_PROMPT, CompetencyBatcher, CompetencyPipeline
+from utils import HTTPBackend
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        prompt = json.loads(self.rfile.read(int(self.headers["Content-Length"])))["prompt"]
+        status, text = self.server.reply(prompt)
+        body = json.dumps({"text": text}).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubServer(ThreadingHTTPServer):
+    """
+    AI service stub: fails the first `failures` requests with HTTP 500, then answers `text`.
+    A callable `text` is given the prompt. Every received prompt is kept in `prompts`.
+    """
+
+    def __init__(self, text, failures=0):
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.text = text
+        self.failures = failures
+        self.prompts = []
+        self.lock = threading.Lock()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}/"
+
+    def reply(self, prompt):
+        with self.lock:
+            self.prompts.append(prompt)
+            if len(self.prompts) <= self.failures:
+                return 500, "unavailable"
+        return 200, self.text(prompt) if callable(self.text) else self.text
+
+
+def competancy(about, experience, title):
+    return utils.AIdata(experience, about, title)
+
+
+class InferenceTestCase(unittest.TestCase):
+
+    def serve(self, text, failures=0):
+        server = StubServer(text, failures)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        utils.set_backend(HTTPBackend(server.url))
+        self.addCleanup(utils.set_backend, None)
+        return server
+
+    def pipeline(self, retries=config.AI_RETRIES):
+        pipeline = CompetencyPipeline(competancy, workers=2, retries=retries, backoff=0.01)
+        self.addCleanup(pipeline.close)
+        return pipeline
+
+
+@mock.patch.object(config, "AI_BATCH_SIZE", 1)
+class PipelineTest(InferenceTestCase):
+
+    def test_returns_backend_text(self):
+        server = self.serve("Backend Java")
+        future = self.pipeline().submit("Builds services", [{"role": "Engineer", "company": "Acme"}], "Engineer")
+        self.assertEqual(future.result(timeout=10), "Backend Java")
+        self.assertEqual(len(server.prompts), 1)
+        self.assertIn("Builds services", server.prompts[0])
+
+    def test_retries_failing_backend(self):
+        server = self.serve("Backend Java", failures=2)
+        future = self.pipeline(retries=3).submit("", [], "Engineer")
+        self.assertEqual(future.result(timeout=10), "Backend Java")
+        self.assertEqual(len(server.prompts), 3)
+
+    def test_gives_up_after_retries(self):
+        server = self.serve("Backend Java", failures=5)
+        future = self.pipeline(retries=2).submit("", [], "Engineer")
+        with self.assertRaises(HTTPError):
+            future.result(timeout=10)
+        self.assertEqual(len(server.prompts), 3)
+
+
+class BatcherTest(InferenceTestCase):
+
+    def infer_all(self, count=4):
+        batcher = CompetencyBatcher(utils.get_backend(), utils._single, batch_size=count, linger=5)
+        with ThreadPoolExecutor(count) as pool:
+            return [pool.submit(batcher.infer, f"Engineer {index}", [], "") for index in range(count)], batcher
+
+    def test_answers_a_full_batch_in_one_request(self):
+        def answer(prompt):
+            profiles = json.loads(prompt[len(BATCH_PROMPT):])
+            return json.dumps([{"id": profile["id"], "competency": "Backend Java"} for profile in profiles])
+
+        server = self.serve(answer)
+        futures, batcher = self.infer_all()
+        self.assertEqual([future.result(timeout=10) for future in futures], ["Backend Java"] * 4)
+        self.assertEqual(batcher.requests, 1)
+        self.assertEqual(len(server.prompts), 1)
+
+    def test_splits_an_unparseable_answer(self):
+        server = self.serve(lambda prompt: "no idea" if prompt.startswith(BATCH_PROMPT) else "Backend Java")
+        futures, batcher = self.infer_all()
+        self.assertEqual([future.result(timeout=10) for future in futures], ["Backend Java"] * 4)
+        # The batch of 4, its two halves, then one plain prompt per profile
+        self.assertEqual(len(server.prompts), 7)
+
+    def test_backend_failure_goes_to_every_caller(self):
+        server = self.serve("Backend Java", failures=1)
+        futures, batcher = self.infer_all()
+        for future in futures:
+            with self.assertRaises(HTTPError):
+                future.result(timeout=10)
+        self.assertEqual(len(server.prompts), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
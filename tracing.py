@@ -0,0 +1,234 @@
+"""
+Per-phase tracing for the LinkedIn Scraper.
+
+The workflow is split into named spans (login, search, harvest, and per profile
+main page, contact info, education, experience, competency and export). Every
+span records its wall time split into pacing sleeps, waits (page readiness and
+selector waits) and the remaining work, plus the number of WebDriver commands
+sent while it was open.
+
+The pacer, the wait layer and the instrumented driver report into the spans
+open on the current thread through `record()`, so spans of the background
+competency workers are not charged for the main thread's sleeps.
+
+Finished spans are written as a JSON trace per run and aggregated into a
+Prometheus textfile for the node exporter's textfile collector.
+"""
+
+import functools
+import itertools
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+import config
+
+
+logger = logging.getLogger(__name__)
+
+_local = threading.local()
+
+
+def _stack():
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+
+def record(key, amount=1):
+    """
+    Adds to a counter of every span open on the current thread.
+
+    Args:
+        key (str): `sleep_s`, `wait_s` or `webdriver_commands`.
+        amount (float): Seconds or number of commands.
+    """
+    for span in getattr(_local, "stack", ()):
+        span[key] += amount
+
+
+def instrument(driver):
+    """
+    Counts every WebDriver command sent through the driver into the open spans.
+
+    Args:
+        driver (Firefox): Browser instance.
+
+    Returns:
+        Firefox: The same driver.
+    """
+    execute = driver.execute
+
+    def traced(command, params=None):
+        record("webdriver_commands")
+        return execute(command, params)
+
+    driver.execute = traced
+    return driver
+
+
+def traced(name):
+    """
+    Decorator running a `LinkedInScraper` method inside a span of its tracer.
+
+    Args:
+        name (str): Span name.
+    """
+    def decorate(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self.tracer.span(name):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def _atomic_write(path, text):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w") as file:
+        file.write(text)
+    os.replace(tmp, path)
+
+
+class Tracer:
+    """
+    Collects the spans of a run.
+
+    Attributes:
+        spans (list): Finished spans as dicts, in the order they finished.
+        started (float): Epoch time the tracer was created; span starts are relative to it.
+    """
+
+    def __init__(self):
+        self.spans = []
+        self.started = time.time()
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name, **attrs):
+        """
+        Opens a span around a block of work.
+
+        Args:
+            name (str): Span name, e.g. `contact`.
+            **attrs: Extra attributes stored with the span (profile URL, method, ...).
+
+        Yields:
+            dict: The span, so attributes can be added while it is open.
+        """
+        stack = _stack()
+        span = {
+            "id": next(self._ids),
+            "parent": stack[-1]["id"] if stack else None,
+            "name": name,
+            "thread": threading.current_thread().name,
+            "start_s": round(time.time() - self.started, 6),
+            "attrs": attrs,
+            "sleep_s": 0.0,
+            "wait_s": 0.0,
+            "webdriver_commands": 0,
+        }
+        stack.append(span)
+        start = time.perf_counter()
+        try:
+            yield span
+        except BaseException as e:
+            span["error"] = type(e).__name__
+            raise
+        finally:
+            stack.pop()
+            span["wall_s"] = time.perf_counter() - start
+            span["work_s"] = max(0.0, span["wall_s"] - span["sleep_s"] - span["wait_s"])
+            with self._lock:
+                self.spans.append(span)
+            logger.debug("span %s: %.3fs wall, %.3fs sleep, %.3fs wait, %d commands", name, span["wall_s"],
+                         span["sleep_s"], span["wait_s"], span["webdriver_commands"])
+
+    def summary(self):
+        """
+        Aggregates the finished spans by name.
+
+        Returns:
+            dict: Per span name the count, errors, wall/sleep/wait/work seconds and WebDriver commands.
+        """
+        totals = {}
+        with self._lock:
+            spans = list(self.spans)
+        for span in spans:
+            total = totals.setdefault(span["name"], {"count": 0, "errors": 0, "wall_s": 0.0, "sleep_s": 0.0,
+                                                     "wait_s": 0.0, "work_s": 0.0, "webdriver_commands": 0})
+            total["count"] += 1
+            total["errors"] += "error" in span
+            for key in ("wall_s", "sleep_s", "wait_s", "work_s", "webdriver_commands"):
+                total[key] += span[key]
+        return totals
+
+    def write_trace(self, path):
+        """
+        Writes all finished spans and their summary as JSON.
+
+        Args:
+            path (str): Output file path.
+        """
+        with self._lock:
+            spans = list(self.spans)
+        _atomic_write(path, json.dumps({"started": self.started, "spans": spans, "summary": self.summary()}, indent=4))
+
+    def write_textfile(self, path, run=""):
+        """
+        Writes the span summary in the Prometheus text format. The file is replaced atomically,
+        so the node exporter never reads a partial file.
+
+        Args:
+            path (str): Output `.prom` file path.
+            run (str): Run ID, exported as a label of the info metric.
+        """
+        summary = self.summary()
+        lines = [
+            "# HELP linkedin_scraper_span_seconds Time spent in spans of the last run, split into sleep, wait and work.",
+            "# TYPE linkedin_scraper_span_seconds gauge",
+        ]
+        for name, total in summary.items():
+            for part in ("sleep", "wait", "work"):
+                lines.append(f'linkedin_scraper_span_seconds{{span="{name}",part="{part}"}} {total[part + "_s"]:.6f}')
+        lines += [
+            "# HELP linkedin_scraper_spans Number of finished spans in the last run.",
+            "# TYPE linkedin_scraper_spans gauge",
+        ]
+        lines += [f'linkedin_scraper_spans{{span="{name}"}} {total["count"]}' for name, total in summary.items()]
+        lines += [
+            "# HELP linkedin_scraper_span_errors Number of spans that ended with an exception in the last run.",
+            "# TYPE linkedin_scraper_span_errors gauge",
+        ]
+        lines += [f'linkedin_scraper_span_errors{{span="{name}"}} {total["errors"]}' for name, total in summary.items()]
+        lines += [
+            "# HELP linkedin_scraper_webdriver_commands WebDriver commands sent in spans of the last run.",
+            "# TYPE linkedin_scraper_webdriver_commands gauge",
+        ]
+        lines += [f'linkedin_scraper_webdriver_commands{{span="{name}"}} {total["webdriver_commands"]}'
+                  for name, total in summary.items()]
+        lines += [
+            "# HELP linkedin_scraper_last_update_timestamp_seconds Time the metrics were last written.",
+            "# TYPE linkedin_scraper_last_update_timestamp_seconds gauge",
+            f'linkedin_scraper_last_update_timestamp_seconds{{run="{run}"}} {time.time():.3f}',
+        ]
+        _atomic_write(path, "\n".join(lines) + "\n")
+
+    def write(self, run):
+        """
+        Writes the JSON trace to `config.TRACE_DIR` and the Prometheus textfile to `config.METRICS_TEXTFILE`.
+
+        Args:
+            run (str): Run ID, used as the trace file name.
+        """
+        if config.TRACE_DIR:
+            self.write_trace(os.path.join(config.TRACE_DIR, run + ".json"))
+        if config.METRICS_TEXTFILE:
+            self.write_textfile(config.METRICS_TEXTFILE, run)
@@ -1,13 +1,123 @@
-from google import genai
+from urllib.parse import urlsplit, urlunsplit
+import json
+from inference import CompetencyBatcher
 import config
+
+
+PROMPT = "------- from the given data tell me the area of expertise and what programming language he uses the most if not able to determine then return most relevent programming language according to the data and reply in 2-3 words only "
+
+
+def build_prompt(title, experience, about):
+    """
+    Builds the competency prompt for one profile.
+    """
+    return f" {title},{experience} ,{about}{PROMPT}"
+
+
+class GeminiBackend:
+    """
+    Generates text with the Gemini API through a single, reused client.
+    """
+
+    def __init__(self, api_key=config.API, model=config.AI_MODEL):
+        from google import genai
+
+        self.model = model
+        self.client = genai.Client(api_key=api_key)
+
+    def generate(self, prompt):
+        response = self.client.models.generate_content(model=self.model, contents=prompt)
+        return response.text
+
+
+class HTTPBackend:
+    """
+    Generates text through a plain HTTP endpoint, e.g. a local stub server for offline tests.
+    The endpoint receives `{"model": ..., "prompt": ...}` as JSON and answers with `{"text": ...}`.
+    """
+
+    def __init__(self, url, model=config.AI_MODEL, timeout=config.AI_TIMEOUT):
+        self.url = url
+        self.model = model
+        self.timeout = timeout
+
+    def generate(self, prompt):
+        import urllib.request
+
+        body = json.dumps({"model": self.model, "prompt": prompt}).encode("utf-8")
+        request = urllib.request.Request(self.url, data=body, headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            return json.loads(response.read().decode("utf-8"))["text"]
+
+
+_backend = None
+
+
+def get_backend():
+    """
+    Returns the configured AI backend, created once and shared by every call.
+    `config.AI_BACKEND` is either "gemini" or the URL of an HTTP endpoint.
+    """
+    global _backend
+    if _backend is None:
+        if config.AI_BACKEND == "gemini":
+            _backend = GeminiBackend()
+        else:
+            _backend = HTTPBackend(config.AI_BACKEND)
+    return _backend
+
+
+def set_backend(backend):
+    """
+    Replaces the AI backend, e.g. with a stub in tests. Any object with a `generate(prompt)` method works.
+    """
+    global _backend, _batcher
+    _backend = backend
+    _batcher = None
+
+
+_batcher = None
+
+
+def _single(title, experience, about):
+    return get_backend().generate(build_prompt(title, experience, about))
+
+
+def get_batcher():
+    """
+    Returns the shared batcher packing concurrent requests into one model call.
+    """
+    global _batcher
+    if _batcher is None:
+        _batcher = CompetencyBatcher(get_backend(), _single)
+    return _batcher
+
+
+def flush_batch():
+    """
+    Sends the requests waiting in the shared batcher right away, if there is one.
+    """
+    if _batcher is not None:
+        _batcher.flush()
+
+
 def AIdata(experience, about,title):
-   
-    client = genai.Client(api_key=config.API)
 
-    response = client.models.generate_content(
-        model="gemini-1.5-flash",
-        contents=f" {title},{experience} ,{about}------- from the given data tell me the area of expertise and what programming language he uses the most if not able to determine then return most relevent programming language according to the data and reply in 2-3 words only ",
-        )
-    return response.text
+    if config.AI_BATCH_SIZE > 1:
+        return get_batcher().infer(title, experience, about)
+    return _single(title, experience, about)
+
+
+def normalize_url(url):
+    """
+    Normalizes a profile URL so the same profile always maps to the same key:
+    drops the query string and fragment, the trailing slash, and lowercases host and slug.
 
+    Args:
+        url (str): Profile URL as found on the page.
 
+    Returns:
+        str: Normalized profile URL.
+    """
+    parts = urlsplit(url.strip())
+    return urlunsplit((parts.scheme.lower() or "https", parts.netloc.lower(), parts.path.rstrip("/").lower(), "", ""))
@@ -0,0 +1,177 @@
+"""
+Instrumented wait layer for the LinkedIn Scraper.
+
+Every element lookup of the scraper goes through `SelectorWait.until()` with a
+name for the selector. For each name the hit/miss count and the time it took the
+element to appear are recorded and persisted between runs, and the timeout of
+the next lookup is chosen from those statistics: selectors that are usually
+absent get a short timeout, required selectors always get the normal one.
+"""
+
+import csv
+import json
+import os
+import time
+import config
+import tracing
+
+
+def _percentile(values, fraction):
+    """
+    Returns the value at the given fraction (0-1) of the sorted values.
+    """
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class SelectorWait:
+    """
+    Wraps WebDriverWait with per-selector statistics and adaptive timeouts.
+
+    Attributes:
+        driver (Firefox): Browser instance the lookups run against.
+        stats_file (str): JSON file the statistics are loaded from and saved to.
+        timeout (float): Timeout used for required and not yet learned selectors.
+        short_timeout (float): Timeout used for selectors that are usually absent.
+        stats (dict): Per-selector statistics keyed by selector name.
+    """
+
+    def __init__(self, driver, stats_file=config.WAIT_STATS_FILE, timeout=config.WAIT_TIMEOUT,
+                 short_timeout=config.WAIT_SHORT_TIMEOUT):
+        self.driver = driver
+        self.stats_file = stats_file
+        self.timeout = timeout
+        self.short_timeout = short_timeout
+        self.stats = {}
+        if stats_file and os.path.exists(stats_file):
+            with open(stats_file) as file:
+                self.stats = json.load(file)
+
+    def _entry(self, name):
+        return self.stats.setdefault(name, {"hits": 0, "misses": 0, "hit_time": 0.0, "miss_time": 0.0, "appear": []})
+
+    def timeout_for(self, name, required=False):
+        """
+        Chooses the timeout for the next lookup of a selector.
+
+        Args:
+            name (str): Selector name.
+            required (bool): Whether the element is expected on every page.
+
+        Returns:
+            float: Timeout in seconds.
+        """
+        entry = self.stats.get(name)
+        if required or entry is None:
+            return self.timeout
+        samples = entry["hits"] + entry["misses"]
+        if samples < config.WAIT_MIN_SAMPLES:
+            return self.timeout
+        if entry["hits"] / samples < config.WAIT_ABSENT_RATE or not entry["appear"]:
+            return self.short_timeout
+        learned = _percentile(entry["appear"], 0.95) * config.WAIT_MARGIN
+        return min(self.timeout, max(self.short_timeout, learned))
+
+    def until(self, name, by, value, required=False):
+        """
+        Waits for an element to be present and records the outcome.
+
+        Args:
+            name (str): Selector name used for the statistics.
+            by (str): Selenium locator strategy.
+            value (str): Locator value.
+            required (bool): Whether the element is expected on every page.
+
+        Returns:
+            WebElement: The located element.
+
+        Raises:
+            TimeoutException: If the element does not appear within the timeout.
+        """
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.support import expected_conditions
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        timeout = self.timeout_for(name, required)
+        entry = self._entry(name)
+        start = time.perf_counter()
+        try:
+            element = WebDriverWait(self.driver, timeout).until(
+                expected_conditions.presence_of_element_located((by, value)))
+        except TimeoutException:
+            elapsed = time.perf_counter() - start
+            entry["misses"] += 1
+            entry["miss_time"] += elapsed
+            tracing.record("wait_s", elapsed)
+            raise
+        elapsed = time.perf_counter() - start
+        tracing.record("wait_s", elapsed)
+        entry["hits"] += 1
+        entry["hit_time"] += elapsed
+        entry["appear"] = (entry["appear"] + [round(elapsed, 3)])[-config.WAIT_HISTORY:]
+        return element
+
+    def save(self):
+        """
+        Persists the statistics so the next run starts with the learned timeouts.
+        """
+        if not self.stats_file:
+            return
+        tmp = self.stats_file + ".tmp"
+        with open(tmp, "w") as file:
+            json.dump(self.stats, file)
+        os.replace(tmp, self.stats_file)
+
+    def report(self):
+        """
+        Summarises the statistics, costliest selectors first.
+
+        Returns:
+            list: One dict per selector with hit rate, timings and the next timeout.
+        """
+        rows = []
+        for name, entry in self.stats.items():
+            samples = entry["hits"] + entry["misses"]
+            rows.append({
+                "selector": name,
+                "hits": entry["hits"],
+                "misses": entry["misses"],
+                "hit_rate": round(entry["hits"] / samples, 3) if samples else 0.0,
+                "mean_appear": round(entry["hit_time"] / entry["hits"], 3) if entry["hits"] else 0.0,
+                "total_wait": round(entry["hit_time"] + entry["miss_time"], 3),
+                "miss_wait": round(entry["miss_time"], 3),
+                "next_timeout": round(self.timeout_for(name), 3),
+            })
+        rows.sort(key=lambda row: row["total_wait"], reverse=True)
+        return rows
+
+    def export(self, path):
+        """
+        Exports the report as CSV or JSON, depending on the file extension.
+
+        Args:
+            path (str): Output file path.
+        """
+        rows = self.report()
+        with open(path, "w", newline="") as file:
+            if path.endswith(".json"):
+                json.dump(rows, file, indent=4)
+                return
+            writer = csv.DictWriter(file, fieldnames=["selector", "hits", "misses", "hit_rate", "mean_appear",
+                                                      "total_wait", "miss_wait", "next_timeout"])
+            writer.writeheader()
+            writer.writerows(rows)
+
+
+if __name__ == "__main__":
+    import sys
+
+    waits = SelectorWait(None)
+    if len(sys.argv) > 1:
+        waits.export(sys.argv[1])
+        print("Wait statistics exported to " + sys.argv[1])
+    else:
+        for row in waits.report():
+            print(f"{row['selector']:<28} hit rate {row['hit_rate']:<6} waited {row['total_wait']}s "
+                  f"(misses {row['miss_wait']}s), next timeout {row['next_timeout']}s")